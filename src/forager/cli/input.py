@@ -1,6 +1,7 @@
 """
 CLI subcommands related to input plugins (e.g., RSS, API).
 """
+import logging
 from pathlib import Path
 from typing import Optional
 from forager.input.rss import RSSFetcher
@@ -16,6 +17,12 @@ app = typer.Typer(
     no_args_is_help=True,
 )
 
+def _configure_logging(debug: bool) -> None:
+    """Route forager's debug log records to the console when debug mode is on."""
+    if debug:
+        logging.basicConfig(format="[%(levelname)s] %(message)s")
+        logging.getLogger("forager").setLevel(logging.DEBUG)
+
 @app.command("rss")
 def rss(
     url: Optional[str] = typer.Argument(
@@ -42,16 +49,23 @@ def rss(
         "-d",
         help="Use debug mode to show detailed information during fetching.",
     ),
+    workers: int = typer.Option(
+        RSSFetcher.MAX_CONCURRENT_FETCHES,
+        "--workers",
+        "-w",
+        help="Number of feeds to fetch concurrently when loading from config.",
+    ),
 ) -> None:
     """
     Fetch and store RSS feeds.
     """
+    _configure_logging(debug)
     if print_only:
         # Print-only mode
         if url:
             try:
                 fetcher = RSSFetcher(url, debug=debug)
-                presenter = RSSPresenter(fetcher)
+                presenter = RSSPresenter(fetcher, verbose=debug)
                 presenter.print_feed_summary()
             except Exception as e:
                 typer.echo(f"[ERROR] Failed to fetch RSS feed {url}: {e}")
@@ -60,10 +74,11 @@ def rss(
             try:
                 config_manager = ConfigManager(config_path)
                 urls = config_manager.get_feed_urls()
-                for url in urls:
+                presenters = [RSSPresenter(RSSFetcher(url, debug=debug), verbose=debug) for url in urls]
+                # fetch every feed up front in parallel, then print them in config order
+                RSSPresenter.fetch_many(presenters, max_workers=workers)
+                for url, presenter in zip(urls, presenters):
                     try:
-                        fetcher = RSSFetcher(url, debug=debug)
-                        presenter = RSSPresenter(fetcher)
                         presenter.print_feed_summary()
                     except Exception as e:
                         typer.echo(f"[ERROR] Failed to fetch RSS feed {url}: {e}")
@@ -92,7 +107,7 @@ def rss(
                     typer.echo("[INFO] Debug mode active - detailed information will be shown")
                 
                 # Modified to pass debug parameter
-                results = RSSFetcher.process_feeds_from_config(config_path, storage, debug=debug)
+                results = RSSFetcher.process_feeds_from_config(config_path, storage, debug=debug, max_workers=workers)
                 
                 # Display results
                 for feed_url, count in results.items():
@@ -126,6 +141,7 @@ def sync_config(
     """
     Synchronize database with configuration file (config is the source of truth).
     """
+    _configure_logging(debug)
     storage = SQLiteStorage(Path("data/forager.db"))
     try:
         typer.echo(f"[INFO] Starting sync from config file {config_path} to database...")
@@ -7,6 +7,21 @@ from typing import Dict, List, Optional, Any, Union
 from forager.storage.sqlite import SQLiteStorage
 from forager.config.manager import ConfigManager, FeedConfig
 
+
+def feed_category(feed: Union[FeedConfig, Dict[str, Any]]) -> str:
+    """
+    Get the category name of a config feed, falling back to 'Default'.
+
+    Args:
+        feed (Union[FeedConfig, Dict[str, Any]]): Feed config object or legacy feed dict
+
+    Returns:
+        str: Stripped category name
+    """
+    category = getattr(feed, 'category', None) or (feed.get('category') if isinstance(feed, dict) else None)
+    return (category or 'Default').strip()
+
+
 class ConfigSynchronizer:
     """Class responsible for synchronization between YAML configuration and database"""
     
@@ -34,26 +49,14 @@ class ConfigSynchronizer:
             Dict[str, int]: Mapping of category names to category IDs
         """
         feeds = self.config_manager.get_enabled_feeds()
-        feed_dicts = [feed.__dict__ if hasattr(feed, '__dict__') else feed for feed in feeds]
         
         # Extract all categories from config
-        category_names = set(
-            getattr(feed, 'category', None) or (feed.get('category') if isinstance(feed, dict) else None) or 'Default'
-            for feed in feed_dicts
-        )
-        category_names = set(name.strip() for name in category_names)
+        category_names = set(feed_category(feed) for feed in feeds)
         
-        # Query existing categories in database
-        db_categories = self.storage.get_categories()
-        db_category_map = {c['name']: c['id'] for c in db_categories}
-        
-        # Insert missing categories
-        for name in category_names:
-            if name not in db_category_map:
-                new_id = self.storage.create_category(name)
-                db_category_map[name] = new_id
-                if self.debug:
-                    print(f"[DEBUG] Created new category: {name} (ID: {new_id})")
+        # Insert missing categories and read back the full mapping in one transaction
+        db_category_map = self.storage.ensure_categories(category_names)
+        if self.debug:
+            print(f"[DEBUG] Category IDs: {db_category_map}")
         
         print(f"[INFO] Synchronized categories from config: {category_names}")
         return db_category_map
@@ -97,11 +100,25 @@ class ConfigSynchronizer:
         for feed in all_config_feeds:
             try:
                 config_feed_urls.add(feed.url)
-                category_name = getattr(feed, 'category', None) or 'Default'
-                category_id = category_map.get(category_name.strip(), category_map.get('Default'))
-                
-                # Determine status based on enabled flag
+                config_hash = feed.config_hash
+                db_feed = db_feeds_by_url.get(feed.url)
                 desired_status = "active" if feed.enabled else "disabled"
+                category_name = feed_category(feed)
+                category_id = category_map.get(category_name, category_map.get('Default'))
+
+                # Skip feeds whose config entry hasn't changed since the last sync, as long
+                # as the stored row still matches it (edits made outside the config, e.g.
+                # through the API, leave config_hash alone and must still be reverted)
+                if (db_feed and db_feed.get('config_hash') == config_hash
+                        and db_feed['name'] == feed.name
+                        and db_feed['poll_interval'] == feed.interval
+                        and db_feed['category_id'] == category_id
+                        and db_feed['status'] == desired_status
+                        and (not getattr(feed, 'id', None) or db_feed.get('string_id') == feed.id)):
+                    results['unchanged'] += 1
+                    if self.debug:
+                        print(f"[DEBUG] Feed config unchanged (hash {config_hash}), skipping: {feed.url}")
+                    continue
                 
                 if self.debug:
                     print(f"[DEBUG] Processing feed: {feed.name} ({feed.url}), category: {category_name}, enabled: {feed.enabled}")
@@ -129,9 +146,8 @@ class ConfigSynchronizer:
                             if self.debug:
                                 print(f"[DEBUG] Created new tag: {tag_name} (ID: {new_tag_id})")
                 
-                if feed.url in db_feeds_by_url:
+                if db_feed:
                     # Update existing feed
-                    db_feed = db_feeds_by_url[feed.url]
                     updates = {}
                     
                     if feed.name != db_feed['name']:
@@ -166,6 +182,36 @@ class ConfigSynchronizer:
                         if self.debug:
                             print(f"[DEBUG] Updating feed status: {db_feed['status']} -> {desired_status}")
                     
+                    field_updates = bool(updates)
+
+                    # Sync tags (only for enabled feeds)
+                    tags_synced = True
+                    if feed.enabled:
+                        feed_id = db_feed['id']
+                        
+                        # Add tags to the feed
+                        if tag_ids:
+                            try:
+                                # Use SQLiteStorage methods to get feed tags
+                                # For each tag ID, check if it's already associated with the feed
+                                for tag_id in tag_ids:
+                                    # Check if tag exists in the feed_tags table for this feed
+                                    # If not, add it
+                                    self.storage.add_tag_to_feed(feed_id, tag_id)
+                                    
+                                if self.debug:
+                                    print(f"[DEBUG] Added tags to feed {feed_id}: {tag_ids}")
+                            except Exception as e:
+                                tags_synced = False
+                                if self.debug:
+                                    print(f"[DEBUG] Error syncing tags for feed {feed_id}: {str(e)}")
+
+                    # Record the config hash whenever it differs from the stored one (e.g. a
+                    # tag-only change, or a row synced before hashes existed), but only once
+                    # the tags are in place, so a failed tag sync is retried next time
+                    if tags_synced and db_feed.get('config_hash') != config_hash:
+                        updates['config_hash'] = config_hash
+                    
                     if updates:
                         if self.debug:
                             print(f"[DEBUG] Update details: {updates}")
@@ -173,7 +219,8 @@ class ConfigSynchronizer:
                         success = self.storage.update_feed(db_feed['id'], updates)
                         if self.debug:
                             print(f"[DEBUG] Update operation success: {success}")
-                            
+                    
+                    if field_updates:
                         results['updated'] += 1
                         if self.debug:
                             print(f"[DEBUG] Updated feed: {feed.url}")
@@ -187,26 +234,6 @@ class ConfigSynchronizer:
                         results['unchanged'] += 1
                         if self.debug:
                             print(f"[DEBUG] Feed properties unchanged: {feed.url}")
-                            
-                    # Sync tags (only for enabled feeds)
-                    if feed.enabled:
-                        feed_id = db_feed['id']
-                        
-                        # Add tags to the feed
-                        if tag_ids:
-                            try:
-                                # Use SQLiteStorage methods to get feed tags
-                                # For each tag ID, check if it's already associated with the feed
-                                for tag_id in tag_ids:
-                                    # Check if tag exists in the feed_tags table for this feed
-                                    # If not, add it
-                                    self.storage.add_tag_to_feed(feed_id, tag_id)
-                                    
-                                if self.debug:
-                                    print(f"[DEBUG] Added tags to feed {feed_id}: {tag_ids}")
-                            except Exception as e:
-                                if self.debug:
-                                    print(f"[DEBUG] Error syncing tags for feed {feed_id}: {str(e)}")
                 else:
                     # Create new feed
                     feed_id = self.storage.create_feed(
@@ -217,22 +244,25 @@ class ConfigSynchronizer:
                         status=desired_status
                     )
                     
-                    # Set string_id using the feed's id from config
-                    if hasattr(feed, 'id') and feed.id:
-                        self.storage.update_feed(feed_id, {'string_id': feed.id})
-                        if self.debug:
-                            print(f"[DEBUG] Set string_id for new feed: {feed.id}")
-                    
-                    results['created'] += 1
-                    if self.debug:
-                        print(f"[DEBUG] Created new feed (ID: {feed_id}): {feed.name} ({feed.url}) with status: {desired_status}")
-                        
                     # Add tags to the new feed (only for enabled feeds)
                     if feed.enabled and tag_ids:
                         for tag_id in tag_ids:
                             self.storage.add_tag_to_feed(feed_id, tag_id)
                         if self.debug:
                             print(f"[DEBUG] Added tags to new feed {feed_id}: {tag_ids}")
+                    
+                    # Set string_id using the feed's id from config, along with the config
+                    # hash (written after the tags so a failure above leaves it unset)
+                    new_feed_updates = {'config_hash': config_hash}
+                    if hasattr(feed, 'id') and feed.id:
+                        new_feed_updates['string_id'] = feed.id
+                    self.storage.update_feed(feed_id, new_feed_updates)
+                    if self.debug and 'string_id' in new_feed_updates:
+                        print(f"[DEBUG] Set string_id for new feed: {feed.id}")
+                    
+                    results['created'] += 1
+                    if self.debug:
+                        print(f"[DEBUG] Created new feed (ID: {feed_id}): {feed.name} ({feed.url}) with status: {desired_status}")
             except Exception as e:
                 error_msg = f"Error processing feed {feed.url}: {str(e)}"
                 results['errors'].append(error_msg)
@@ -291,21 +321,10 @@ class ConfigSynchronizer:
             dict: Mapping of category names to category IDs
         """
         # Extract all categories from config
-        category_names = set(
-            getattr(feed, 'category', None) or (feed.get('category') if isinstance(feed, dict) else None) or 'Default'
-            for feed in config_feeds
-        )
-        category_names = set(name.strip() for name in category_names)
-        
-        # Query existing categories in database
-        db_categories = storage.get_categories()
-        db_category_map = {c['name']: c['id'] for c in db_categories}
+        category_names = set(feed_category(feed) for feed in config_feeds)
         
-        # Insert missing categories
-        for name in category_names:
-            if name not in db_category_map:
-                new_id = storage.create_category(name)
-                db_category_map[name] = new_id
+        # Insert missing categories and read back the full mapping in one transaction
+        db_category_map = storage.ensure_categories(category_names)
                 
         print(f"[INFO] Synchronized categories: {category_names}")
         return db_category_map 
\ No newline at end of file
@@ -1,15 +1,16 @@
 """
 Configuration management module for Forager.
 """
+import hashlib
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, Tuple
 import yaml
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import timedelta
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FeedConfig:
-    """Configuration for a single RSS feed."""
+    """Configuration for a single RSS feed (immutable and hashable)."""
     id: str
     name: str
     url: str
@@ -17,7 +18,13 @@ class FeedConfig:
     enabled: bool
     category: Optional[str] = None
     string_id: Optional[str] = None
-    tags: List[str] = field(default_factory=list)
+    tags: Tuple[str, ...] = ()
+
+    @property
+    def config_hash(self) -> str:
+        """Short digest of the synced fields, used to detect unchanged feeds between syncs."""
+        key = (self.name, self.url, self.interval, self.enabled, self.category, self.id, self.tags)
+        return hashlib.blake2b(repr(key).encode(), digest_size=8).hexdigest()
 
 class ConfigError(Exception):
     """Base exception for configuration errors."""
@@ -80,7 +87,7 @@ class ConfigManager:
                     enabled=bool(feed['enabled']),
                     category=feed.get('category'),
                     string_id=feed.get('string_id'),
-                    tags=feed.get('tags', [])
+                    tags=tuple(feed.get('tags') or ())
                 ))
             except (ValueError, TypeError) as e:
                 raise ConfigValidationError(
@@ -1,18 +1,41 @@
 from email.utils import parsedate_to_datetime
+import logging
+import operator
 import feedparser
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Iterator, List, Dict, Optional, Tuple
 from pathlib import Path
 import datetime
 from forager.storage.sqlite import SQLiteStorage
 from forager.config.manager import ConfigManager, ConfigError
-from forager.config.config_sync import ConfigSynchronizer
+from forager.config.config_sync import ConfigSynchronizer, feed_category
 from forager.input.preprocessor import URLPreprocessor
 from forager.utils.feed_parser_adapter import FeedParserAdapter
 from forager.utils.date_utils import parse_date_flexible
 
+logger = logging.getLogger(__name__)
+
+# Fetches the fields every article needs from an entry in a single C-level call
+_get_core_fields = operator.itemgetter("title", "link", "published")
+
+
+def _content_value(entry) -> Optional[str]:
+    """Return the value of an entry's first content block, or None if it has none."""
+    content = entry.get("content")
+    return content[0].get("value") if content else None
+
+
+def _has_required_fields(entry) -> bool:
+    """Return True if an entry has the title, link and published date every article needs."""
+    return hasattr(entry, "title") and hasattr(entry, "link") and hasattr(entry, "published")
+
+
 class RSSFetcher:
     """Handles fetching, parsing and storing RSS feeds."""
 
+    # Default number of feeds fetched concurrently by process_feeds_from_config
+    MAX_CONCURRENT_FETCHES = 8
+
     def __init__(self, 
                  url: str, 
                  storage: Optional[SQLiteStorage] = None, 
@@ -34,6 +57,80 @@ class RSSFetcher:
         # if feed_parser is provided, use it, otherwise create a new one with the user_agent
         self.feed_parser = feed_parser or FeedParserAdapter.create_with_defaults(user_agent=user_agent)
         self.debug = debug
+        # HTTP cache validators from the previous poll; sent as a conditional GET
+        # and refreshed from each response
+        self.etag: Optional[str] = None
+        self.modified: Optional[str] = None
+        # digest of the last fetched body, for servers that send no validators
+        self.content_hash: Optional[str] = None
+        self.not_modified = False
+
+    def _update_cache_validators(self, feed: feedparser.FeedParserDict) -> bool:
+        """
+        Record the cache validators of a fetched feed.
+
+        Args:
+            feed (feedparser.FeedParserDict): The parsed feed.
+
+        Returns:
+            bool: True if the feed is unchanged (HTTP 304 or identical body).
+        """
+        self.not_modified = feed.get('status') == 304 or feed.get('not_modified', False)
+        if self.not_modified:
+            print(f"[INFO] Feed not modified since last fetch: {self.url}")
+        else:
+            self.etag = feed.get('etag')
+            self.modified = feed.get('modified')
+            self.content_hash = feed.get('content_hash')
+        return self.not_modified
+
+    @staticmethod
+    def _parser_options(include_details: bool) -> Dict[str, bool]:
+        """
+        Build the feedparser options for a fetch.
+
+        HTML sanitizing and relative URI resolution are the most expensive parts of
+        feedparser and only matter for summary/content, so they are turned off when
+        only title, link and published date are extracted.
+
+        Args:
+            include_details (bool): Whether summary and content will be extracted.
+
+        Returns:
+            Dict[str, bool]: Keyword arguments for feedparser.parse.
+        """
+        return {
+            "sanitize_html": include_details,
+            "resolve_relative_uris": include_details,
+        }
+
+    @staticmethod
+    def _build_article(entry: feedparser.FeedParserDict, include_details: bool) -> Dict[str, str]:
+        """
+        Build the article dict for a feed entry.
+
+        Args:
+            entry (feedparser.FeedParserDict): The parsed feed entry.
+            include_details (bool): Whether to include summary and content.
+
+        Returns:
+            Dict[str, str]: The title, link and published date of the entry, plus
+            summary and content if requested.
+
+        Raises:
+            KeyError: If the entry has no title, link or published date.
+        """
+        title, link, published = _get_core_fields(entry)
+        article = {
+            "title": title,
+            "link": link,
+            "published": published
+        }
+        # Only include summary and content if requested
+        if include_details:
+            article["summary"] = entry.get("summary")
+            article["content"] = _content_value(entry)
+        return article
 
     def fetch_direct(self, include_details: bool = False) -> List[Dict[str, str]]:
         """
@@ -50,26 +147,16 @@ class RSSFetcher:
         print(f"[DEBUG] Directly fetching RSS feed from: {self.url}")
         
         # Use feedparser directly without anti-scraping
-        feed = feedparser.parse(self.url)
+        feed = feedparser.parse(self.url, etag=self.etag, modified=self.modified,
+                                **self._parser_options(include_details))
+        if self._update_cache_validators(feed):
+            return []
 
         if not feed.entries:
             print("[WARNING] No entries found in the feed.")
             return []
 
-        articles = []
-        for entry in feed.entries:
-            article = {
-                "title": entry.title,
-                "link": entry.link,
-                "published": entry.published
-            }
-            
-            # Only include summary and content if requested
-            if include_details:
-                article["summary"] = entry.get("summary")
-                article["content"] = entry.get("content", [{}])[0].get("value") if entry.get("content") else None
-            
-            articles.append(article)
+        articles = [self._build_article(entry, include_details) for entry in feed.entries]
 
         # process all articles
         articles = URLPreprocessor.process_articles(articles)
@@ -82,7 +169,9 @@ class RSSFetcher:
         """
         print(f"[DEBUG] Directly fetching RSS feed from: {self.url}")
         
-        feed = feedparser.parse(self.url)
+        feed = feedparser.parse(self.url, etag=self.etag, modified=self.modified)
+        if self._update_cache_validators(feed):
+            return []
         print(f"[DEBUG] bozo flag: {feed.bozo}")
         if feed.bozo:
             print(f"[DEBUG] bozo_exception: {feed.bozo_exception!r}")
@@ -101,24 +190,9 @@ class RSSFetcher:
             print(f"    published: {entry.get('published', 'N/A')}")
             if include_details:
                 print(f"    summary: {entry.get('summary')!r}")
-                content = entry.get("content", [{}])
-                content_value = content[0].get('value') if content else 'N/A'
-                print(f"    content: {content_value!r}")
-
-        articles = []
-        for entry in feed.entries:
-            article = {
-                "title": entry.title,
-                "link": entry.link,
-                "published": entry.published
-            }
-            if include_details:
-                article["summary"] = entry.get("summary")
-                article["content"] = (
-                    entry.get("content", [{}])[0].get("value")
-                    if entry.get("content") else None
-                )
-            articles.append(article)
+                print(f"    content: {_content_value(entry) or 'N/A'!r}")
+
+        articles = [self._build_article(entry, include_details) for entry in feed.entries]
 
         return URLPreprocessor.process_articles(articles)
 
@@ -133,58 +207,58 @@ class RSSFetcher:
             List[Dict[str, str]]: A list of dictionaries containing
             the title, link, and published date of each article in the feed.
         """
-        print(f"[INFO] Fetching RSS feed with anti-scraping from: {self.url}")
-        
-        # use the feed parser to parse the feed
         try:
-            if self.debug:
-                print(f"[DEBUG] Using feed_parser with anti-scraping for: {self.url}")
-            feed = self.feed_parser.parse(self.url, debug=self.debug)
-            
-            if not feed.entries:
-                print("[WARNING] No entries found in the feed.")
-                return []
-            
-            if self.debug:
-                print(f"[DEBUG] Processing {len(feed.entries)} entries from feed")
-            
-            articles = []
-            for entry in feed.entries:
-                try:
-                    if self.debug and hasattr(entry, 'title') and hasattr(entry, 'link'):
-                        print(f"[DEBUG] Processing entry: {entry.title[:50]}... ({entry.link})")
-                    
-                    article = {
-                        "title": entry.title,
-                        "link": entry.link,
-                        "published": entry.published
-                    }
-                    
-                    # Only include summary and content if requested
-                    if include_details:
-                        article["summary"] = entry.get("summary")
-                        article["content"] = entry.get("content", [{}])[0].get("value") if entry.get("content") else None
-                    
-                    articles.append(article)
-                except Exception as e:
-                    if self.debug:
-                        print(f"[DEBUG] Error processing entry: {str(e)}")
-                        if hasattr(entry, 'link'):
-                            print(f"[DEBUG] Problem entry link: {entry.link}")
-            
-            # process all articles
-            if self.debug:
-                print(f"[DEBUG] Preprocessing {len(articles)} articles with URLPreprocessor")
-            articles = URLPreprocessor.process_articles(articles)
-            
-            return articles
+            return list(self._iter_with_anti_scraping(include_details))
         except Exception as e:
             print(f"[ERROR] Failed to fetch feed with anti-scraping: {str(e)}")
-            if self.debug:
-                import traceback
-                print(f"[DEBUG] Error traceback:\n{traceback.format_exc()}")
+            logger.debug("Error traceback", exc_info=True)
             return []
 
+    def _iter_with_anti_scraping(self, include_details: bool) -> Iterator[Dict[str, str]]:
+        """
+        Fetch the feed with anti-scraping measures and yield its articles one at a time.
+
+        Unlike fetch_with_anti_scraping, errors are raised to the caller.
+
+        Args:
+            include_details (bool): Whether to include summary and content in the results.
+
+        Yields:
+            Dict[str, str]: The title, link, and published date of each article in the feed.
+        """
+        print(f"[INFO] Fetching RSS feed with anti-scraping from: {self.url}")
+        
+        # use the feed parser to parse the feed
+        logger.debug("Using feed_parser with anti-scraping for: %s", self.url)
+        feed = self.feed_parser.parse(
+            self.url,
+            debug=self.debug,
+            etag=self.etag,
+            modified=self.modified,
+            content_hash=self.content_hash,
+            **self._parser_options(include_details)
+        )
+        if self._update_cache_validators(feed):
+            return
+        
+        if not feed.entries:
+            print("[WARNING] No entries found in the feed.")
+            return
+        
+        logger.debug("Processing %s entries from feed", len(feed.entries))
+        
+        # drop entries missing required fields up front so the build loop needs no try/except
+        entries = [entry for entry in feed.entries if _has_required_fields(entry)]
+        if len(entries) < len(feed.entries):
+            logger.debug("Skipping %s entries without title, link or published date",
+                         len(feed.entries) - len(entries))
+        
+        for entry in entries:
+            article = self._build_article(entry, include_details)
+            logger.debug("Processing entry: %.50s... (%s)", article["title"], article["link"])
+            # clean the article URL as it is produced
+            yield URLPreprocessor.process_article(article)
+
     def fetch(self, include_details: bool = False) -> List[Dict[str, str]]:
         """
         Fetch and parse the provided RSS feed using anti-scraping measures.
@@ -198,11 +272,29 @@ class RSSFetcher:
             the title, link, and published date of each article in the feed.
         """
         if self.debug:
-            print("[DEBUG] Using direct debug mode for fetching")
+            logger.debug("Using direct debug mode for fetching")
             return self.fetch_direct_debug(include_details)
         else:
             return self.fetch_with_anti_scraping(include_details)
 
+    def iter_fetch(self, include_details: bool = False) -> Iterator[Dict[str, str]]:
+        """
+        Like fetch(), but yield the articles one at a time instead of building a list.
+
+        Consumers that write articles out as they go (e.g. exports) keep only one
+        article dict alive at a time. Fetch errors are raised to the caller.
+
+        Args:
+            include_details (bool): Whether to include summary and content in the results. Defaults to False.
+
+        Yields:
+            Dict[str, str]: The title, link, and published date of each article in the feed.
+        """
+        if self.debug:
+            yield from self.fetch_direct_debug(include_details)
+        else:
+            yield from self._iter_with_anti_scraping(include_details)
+
     def ensure_default_category(self) -> int:
         """Ensure default category exists and return its ID."""
         if not self.storage:
@@ -214,29 +306,32 @@ class RSSFetcher:
                 return category["id"]
         return self.storage.create_category("Default")
 
-    def process_feed(self, name: str, interval: int, category_id: Optional[int] = None) -> int:
+    def process_feed(self, name: str, interval: int, category_id: Optional[int] = None,
+                     articles: Optional[List[Dict[str, str]]] = None,
+                     existing_feed: Optional[Dict[str, Any]] = None) -> int:
         """
         Process a single feed: fetch and store articles.
         新增 category_id 参数，优先使用传入的 category_id。
+
+        If articles is provided (e.g. fetched concurrently by process_feeds_from_config),
+        the network fetch is skipped and those articles are stored instead.
+        If existing_feed (the feed's database row) is provided, the lookup by URL is skipped.
         """
         if not self.storage:
             raise ValueError("Storage backend not initialized")
         try:
             # check if the feed already exists  
-            if self.debug:
-                print(f"[DEBUG] Checking if feed exists: {self.url}")
-            existing_feeds = self.storage.get_feeds()
-            feed_exists = any(f["url"] == self.url for f in existing_feeds)
-            if not feed_exists:
+            if existing_feed is None:
+                logger.debug("Checking if feed exists: %s", self.url)
+                existing_feed = self.storage.get_feed_by_url(self.url)
+            if existing_feed is None:
                 # create a new feed
-                if self.debug:
-                    print(f"[DEBUG] Creating new feed in database: {self.url}")
+                logger.debug("Creating new feed in database: %s", self.url)
                 try:
                     # 优先用传入的 category_id
                     if category_id is None:
                         category_id = self.ensure_default_category()
-                    if self.debug:
-                        print(f"[DEBUG] Using category ID: {category_id}")
+                    logger.debug("Using category ID: %s", category_id)
                     feed_id = self.storage.create_feed(
                         category_id=category_id,
                         name=name,
@@ -244,42 +339,34 @@ class RSSFetcher:
                         poll_interval=interval,
                         status="active"
                     )
-                    if self.debug:
-                        print(f"[DEBUG] Created feed with ID: {feed_id}")
+                    logger.debug("Created feed with ID: %s", feed_id)
                 except Exception as e:
                     print(f"[ERROR] Failed to create feed in database: {str(e)}")
                     raise
             else:
                 # get the existing feed ID and update feed if properties have changed
-                if self.debug:
-                    print(f"[DEBUG] Feed already exists: {self.url}")
+                logger.debug("Feed already exists: %s", self.url)
                 try:
-                    existing_feed = next(f for f in existing_feeds if f["url"] == self.url)
                     feed_id = existing_feed["id"]
-                    if self.debug:
-                        print(f"[DEBUG] Using existing feed ID: {feed_id}")
+                    logger.debug("Using existing feed ID: %s", feed_id)
                     
                     # Check if any properties need to be updated
                     updates = {}
                     if name != existing_feed["name"]:
                         updates["name"] = name
-                        if self.debug:
-                            print(f"[DEBUG] Updating feed name: {existing_feed['name']} -> {name}")
+                        logger.debug("Updating feed name: %s -> %s", existing_feed['name'], name)
                     
                     if interval != existing_feed["poll_interval"]:
                         updates["poll_interval"] = interval
-                        if self.debug:
-                            print(f"[DEBUG] Updating feed interval: {existing_feed['poll_interval']} -> {interval}")
+                        logger.debug("Updating feed interval: %s -> %s", existing_feed['poll_interval'], interval)
                     
                     if category_id is not None and category_id != existing_feed["category_id"]:
                         updates["category_id"] = category_id
-                        if self.debug:
-                            print(f"[DEBUG] Updating feed category: {existing_feed['category_id']} -> {category_id}")
+                        logger.debug("Updating feed category: %s -> %s", existing_feed['category_id'], category_id)
                     
                     # If there are updates, apply them
                     if updates:
-                        if self.debug:
-                            print(f"[DEBUG] Updating feed properties for feed ID {feed_id}: {updates}")
+                        logger.debug("Updating feed properties for feed ID %s: %s", feed_id, updates)
                         success = self.storage.update_feed(feed_id, updates)
                         if success:
                             print(f"[INFO] Updated feed properties for: {self.url}")
@@ -289,61 +376,39 @@ class RSSFetcher:
                     print(f"[ERROR] Failed to update existing feed: {str(e)}")
                     raise
             # fetch articles - we don't need summary or content for database storage
-            if self.debug:
-                print(f"[DEBUG] Fetching articles for database storage")
-            articles = self.fetch(include_details=False)
+            if articles is None:
+                logger.debug("Fetching articles for database storage")
+                cache_headers = self.storage.get_feed_cache_headers(feed_id)
+                self.etag = cache_headers["etag"]
+                self.modified = cache_headers["last_modified"]
+                self.content_hash = cache_headers["content_hash"]
+                articles = self.fetch(include_details=False)
+            article_ids = []
             if articles:
-                # get existing articles
-                if self.debug:
-                    print(f"[DEBUG] Getting existing articles for feed ID: {feed_id}")
+                # duplicates are dropped by the database (INSERT OR IGNORE on the unique link),
+                # so there is no need to load the feed's existing articles here
+                logger.debug("Saving %s fetched articles to database", len(articles))
                 try:
-                    existing_articles = self.storage.get_articles(feed_id=feed_id)
-                    existing_article_links = {article["link"] for article in existing_articles}
-                    if self.debug:
-                        print(f"[DEBUG] Found {len(existing_article_links)} existing articles")
+                    # converted lazily so save_articles can stream them in batches
+                    article_ids = self.storage.save_articles(feed_id, self._to_db_articles(articles))
+                    saved_count = len(article_ids)
+                    logger.debug("Successfully saved %s new articles (skipped %s duplicates or invalid)",
+                                 saved_count, len(articles) - saved_count)
+                    if article_ids:
+                        logger.debug("Article IDs: %s", article_ids)
                 except Exception as e:
-                    print(f"[ERROR] Failed to get existing articles: {str(e)}")
+                    print(f"[ERROR] Failed to save articles to database: {str(e)}")
+                    # forget this fetch's validators too, so a fetcher reused for the next
+                    # poll downloads and parses the feed again instead of matching its
+                    # content hash (or getting a 304) and skipping the unsaved articles
+                    self.etag = self.modified = self.content_hash = None
                     raise
-                # get new articles
-                new_articles = [article for article in articles if article["link"] not in existing_article_links]
-                if self.debug:
-                    print(f"[DEBUG] Found {len(new_articles)} new articles out of {len(articles)} total")
-                db_articles = []
-                for article in new_articles:
-                    try:
-                        if self.debug:
-                            print(f"[DEBUG] Parsing date: {article['published']}")
-                        published_dt = parse_date_flexible(article["published"])
-                        if self.debug:
-                            print(f"[DEBUG] Parsed date: {article['published']} -> {published_dt}")
-                        db_article = {
-                            "title": article["title"],
-                            "link": article["link"],
-                            "published_at": published_dt,
-                            "status": "new"
-                        }
-                        db_articles.append(db_article)
-                    except Exception as e:
-                        print(f"[ERROR] Failed to process article {article['link']}: {str(e)}")
-                        # Continue with other articles instead of failing completely
-                # save articles
-                if db_articles:
-                    if self.debug:
-                        print(f"[DEBUG] Saving {len(db_articles)} articles to database")
-                    try:
-                        article_ids = self.storage.save_articles(feed_id, db_articles)
-                        saved_count = len(article_ids)
-                        if self.debug:
-                            print(f"[DEBUG] Successfully saved {saved_count} new articles (skipped {len(db_articles) - saved_count} duplicates)")
-                            if article_ids:
-                                print(f"[DEBUG] Article IDs: {article_ids}")
-                    except Exception as e:
-                        print(f"[ERROR] Failed to save articles to database: {str(e)}")
-                        raise
-                else:
-                    if self.debug:
-                        print("[DEBUG] No new articles to save")
-                    article_ids = []
+            # remember the validators of a changed feed for the next conditional GET, but only
+            # once its articles are stored: saved earlier, a failed save would make the next
+            # poll get a 304 (or an identical body hash) and never retry those articles
+            if not self.not_modified and (self.etag or self.modified or self.content_hash):
+                self.storage.update_feed_cache_headers(feed_id, self.etag, self.modified, self.content_hash)
+            if articles:
                 if article_ids:
                     print(f"[INFO] Saved {len(article_ids)} articles from {self.url}")
                 else:
@@ -354,6 +419,84 @@ class RSSFetcher:
             print(f"[ERROR] Exception in process_feed: {str(e)}")
             raise
 
+    @staticmethod
+    def _to_db_articles(articles: List[Dict[str, str]]) -> Iterator[Dict[str, Any]]:
+        """
+        Convert fetched articles into storage records, one at a time.
+
+        Articles whose published date cannot be parsed are reported and skipped.
+
+        Args:
+            articles (List[Dict[str, str]]): Articles as returned by fetch().
+
+        Yields:
+            Dict[str, Any]: Article dicts in the form expected by save_articles.
+        """
+        for article in articles:
+            try:
+                logger.debug("Parsing date: %s", article['published'])
+                published_dt = parse_date_flexible(article["published"])
+                logger.debug("Parsed date: %s -> %s", article['published'], published_dt)
+                yield {
+                    "title": article["title"],
+                    "link": article["link"],
+                    "published_at": published_dt,
+                    "status": "new"
+                }
+            except Exception as e:
+                print(f"[ERROR] Failed to process article {article['link']}: {str(e)}")
+                # Continue with other articles instead of failing completely
+
+    @staticmethod
+    def iter_fetch_all(fetchers: List["RSSFetcher"], max_workers: int,
+                       include_details: bool = False) -> Iterator[Tuple[int, Any]]:
+        """
+        Fetch several feeds concurrently and yield each result as soon as it arrives.
+
+        The caller can store a feed while the remaining fetches are still in flight,
+        so disk writes overlap with network waits instead of following all of them.
+        Storage still happens on the caller's thread.
+
+        Args:
+            fetchers (List[RSSFetcher]): Fetchers to run.
+            max_workers (int): Maximum number of concurrent fetches.
+            include_details (bool): Whether to include summary and content. Defaults to False.
+
+        Yields:
+            Tuple[int, Any]: The fetcher's index and its article list, or the exception
+            raised by that fetch, in completion order.
+        """
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(fetchers)))) as executor:
+            futures = {executor.submit(fetcher.fetch, include_details): i for i, fetcher in enumerate(fetchers)}
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = e
+                yield futures[future], result
+
+    @staticmethod
+    def fetch_all(fetchers: List["RSSFetcher"], max_workers: int, include_details: bool = False) -> List[Any]:
+        """
+        Fetch several feeds concurrently in a thread pool.
+
+        Only the network work happens in the workers; storage is left to the caller
+        so the SQLite connection stays on one thread.
+
+        Args:
+            fetchers (List[RSSFetcher]): Fetchers to run.
+            max_workers (int): Maximum number of concurrent fetches.
+            include_details (bool): Whether to include summary and content. Defaults to False.
+
+        Returns:
+            List[Any]: Per-fetcher article lists, or the exception raised by that fetch,
+            in the same order as fetchers.
+        """
+        results: List[Any] = [None] * len(fetchers)
+        for i, result in RSSFetcher.iter_fetch_all(fetchers, max_workers, include_details):
+            results[i] = result
+        return results
+
     @classmethod
     def sync_categories_from_config(cls, config_feeds, storage) -> dict:
         """
@@ -365,42 +508,59 @@ class RSSFetcher:
         return ConfigSynchronizer.sync_categories_from_config(config_feeds, storage)
 
     @classmethod
-    def process_feeds_from_config(cls, config_path: Path, storage: SQLiteStorage, user_agent: Optional[str] = None, debug: bool = False) -> Dict[str, int]:
+    def process_feeds_from_config(cls, config_path: Path, storage: SQLiteStorage, user_agent: Optional[str] = None, debug: bool = False,
+                                  max_workers: Optional[int] = None) -> Dict[str, int]:
         """
         Process all feeds from config file.
+
+        Feeds are fetched concurrently by up to max_workers threads (defaults to
+        MAX_CONCURRENT_FETCHES) and each one is stored as soon as its fetch completes.
         """
-        if debug:
-            print(f"[DEBUG] Loading feeds from config: {config_path}")
+        logger.debug("Loading feeds from config: %s", config_path)
         try:
             config_manager = ConfigManager(config_path)
             feeds = config_manager.get_enabled_feeds()
-            if debug:
-                print(f"[DEBUG] Found {len(feeds)} enabled feeds in config")
+            logger.debug("Found %s enabled feeds in config", len(feeds))
+            if logger.isEnabledFor(logging.DEBUG):
                 for i, feed in enumerate(feeds):
-                    print(f"[DEBUG] Feed {i+1}: {feed.name} - {feed.url}")
+                    logger.debug("Feed %s: %s - %s", i + 1, feed.name, feed.url)
             
             # 分类同步 - 使用新的ConfigSynchronizer
-            feed_dicts = [feed.__dict__ if hasattr(feed, '__dict__') else feed for feed in feeds]
-            
             # 创建ConfigSynchronizer实例进行分类同步
             config_sync = ConfigSynchronizer(config_path, storage, debug=debug)
             category_map = config_sync.sync_categories()
             
             # create a shared feed parser to reuse the HTTP session
-            if debug:
-                print("[DEBUG] Creating shared feed parser")
+            logger.debug("Creating shared feed parser")
             feed_parser = FeedParserAdapter.create_with_defaults(user_agent=user_agent)
-            results = {}
-            
-            for i, feed in enumerate(feeds):
-                if debug:
-                    print(f"\n[DEBUG] Processing feed {i+1}/{len(feeds)}: {feed.name} ({feed.url})")
+            # report results in config order whatever order the fetches finish in
+            results = dict.fromkeys(feed.url for feed in feeds)
+
+            # fetch all feeds concurrently and store each one as it arrives
+            fetchers = [cls(feed.url, storage, feed_parser=feed_parser, debug=debug) for feed in feeds]
+            # load the known feeds once; their rows seed the cache validators of each
+            # fetcher and are reused by process_feed instead of a lookup per feed
+            db_feeds_by_url = {f["url"]: f for f in storage.get_feeds()}
+            for fetcher in fetchers:
+                db_feed = db_feeds_by_url.get(fetcher.url)
+                if db_feed:
+                    fetcher.etag = db_feed.get("etag")
+                    fetcher.modified = db_feed.get("last_modified")
+                    fetcher.content_hash = db_feed.get("content_hash")
+            max_workers = max_workers or cls.MAX_CONCURRENT_FETCHES
+            logger.debug("Fetching %s feeds with up to %s worker threads", len(fetchers), max_workers)
+
+            for i, articles in cls.iter_fetch_all(fetchers, max_workers):
+                feed, fetcher = feeds[i], fetchers[i]
+                logger.debug("Processing feed %s/%s: %s (%s)", i + 1, len(feeds), feed.name, feed.url)
                 try:
+                    if isinstance(articles, Exception):
+                        raise articles
                     # Get category name from feed
-                    category_name = getattr(feed, 'category', None) or (feed.get('category') if isinstance(feed, dict) else None) or 'Default'
+                    category_name = feed_category(feed)
                     # Check if category exists in the map
-                    if category_name.strip() in category_map:
-                        category_id = category_map[category_name.strip()]
+                    if category_name in category_map:
+                        category_id = category_map[category_name]
                     else:
                         # If Default is not in the map, use the first available category or create a new one
                         if 'Default' in category_map:
@@ -413,36 +573,31 @@ class RSSFetcher:
                         else:
                             # Create a new category with the specified name
                             print(f"[INFO] Creating new category: {category_name}")
-                            category_id = storage.create_category(category_name.strip())
-                            category_map[category_name.strip()] = category_id
-                    fetcher = cls(feed.url, storage, feed_parser=feed_parser, debug=debug)
-                    # pass category_id to process_feed
-                    article_count = fetcher.process_feed(feed.name, feed.interval, category_id=category_id)
+                            category_id = storage.create_category(category_name)
+                            category_map[category_name] = category_id
+                    # pass category_id, the prefetched articles and the known feed row to process_feed
+                    article_count = fetcher.process_feed(
+                        feed.name, feed.interval, category_id=category_id,
+                        articles=articles, existing_feed=db_feeds_by_url.get(feed.url)
+                    )
                     results[feed.url] = article_count
                 except Exception as e:
                     print(f"[ERROR] Failed to process feed {feed.url}: {e}")
-                    if debug:
-                        import traceback
-                        print(f"[DEBUG] Error traceback:\n{traceback.format_exc()}")
+                    logger.debug("Error traceback", exc_info=True)
                     try:
-                        if debug:
-                            print(f"[DEBUG] Updating error status for feed: {feed.url}")
-                        existing_feeds = storage.get_feeds()
-                        feed_id = next((f["id"] for f in existing_feeds if f["url"] == feed.url), None)
+                        logger.debug("Updating error status for feed: %s", feed.url)
+                        existing_feed = db_feeds_by_url.get(feed.url) or storage.get_feed_by_url(feed.url)
+                        feed_id = existing_feed["id"] if existing_feed else None
                         if feed_id:
-                            if debug:
-                                print(f"[DEBUG] Updating error status for feed ID: {feed_id}")
+                            logger.debug("Updating error status for feed ID: %s", feed_id)
                             storage.update_feed_error(feed_id, str(e))
                         else:
-                            if debug:
-                                print(f"[DEBUG] Feed not found in database to update error status: {feed.url}")
+                            logger.debug("Feed not found in database to update error status: %s", feed.url)
                     except Exception as update_error:
                         print(f"[ERROR] Failed to update error status: {update_error}")
                     results[feed.url] = -1  # -1 means error
             return results
         except Exception as e:
             print(f"[ERROR] Failed to process feeds from config: {e}")
-            import traceback
-            if debug:
-                print(f"[DEBUG] Error traceback:\n{traceback.format_exc()}")
+            logger.debug("Error traceback", exc_info=True)
             return {}
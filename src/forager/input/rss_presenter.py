@@ -6,10 +6,18 @@ The RSSPresenter class handles the formatting and display of RSS feed data, sepa
 presentation logic from data fetching and storage.
 """
 
-from typing import List, Dict, Optional
+import sys
+import time
+from itertools import chain
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 from forager.input.rss import RSSFetcher
 
+# Horizontal rule between articles in the console summary
+_RULE = "-" * 40
+# Written after each article in the markdown export
+_SEPARATOR = "\n\n---\n\n"
+
 
 class RSSPresenter:
     """
@@ -20,16 +28,92 @@ class RSSPresenter:
 
     Attributes:
         fetcher (RSSFetcher): The RSSFetcher instance used to fetch feed data.
+        cache_ttl (Optional[float]): Seconds fetched articles are reused for, or None
+                                     to reuse them until invalidate() is called.
+        verbose (bool): Whether to list the fields of each feed entry.
     """
 
-    def __init__(self, fetcher: RSSFetcher):
+    def __init__(self, fetcher: RSSFetcher, cache_ttl: Optional[float] = None, verbose: bool = False):
         """
         Initialize the RSSPresenter with an RSSFetcher instance.
 
         Args:
             fetcher (RSSFetcher): An instance of RSSFetcher to fetch feed data.
+            cache_ttl (Optional[float]): Seconds to reuse fetched articles across
+                                         presenter calls. None caches until invalidate().
+            verbose (bool): Whether to list the fields of each feed entry. Defaults to False.
         """
         self.fetcher = fetcher
+        self.verbose = verbose
+        self.cache_ttl = cache_ttl
+        # fetched articles and their fetch time, keyed by include_details
+        self._cache: Dict[bool, Tuple[float, List[Dict[str, str]]]] = {}
+
+    def _get_articles(self, include_details: bool) -> List[Dict[str, str]]:
+        """
+        Return the feed's articles, fetching them only if there is no fresh cached copy.
+
+        Args:
+            include_details (bool): Whether to include summary and content.
+
+        Returns:
+            List[Dict[str, str]]: The fetched articles.
+        """
+        articles = self._cached_articles(include_details)
+        if articles is None:
+            articles = self.fetcher.fetch(include_details=include_details)
+            self._cache[include_details] = (time.monotonic(), articles)
+        return articles
+
+    def _cached_articles(self, include_details: bool) -> Optional[List[Dict[str, str]]]:
+        """
+        Return the cached articles if they have not expired.
+
+        Args:
+            include_details (bool): Whether the articles include summary and content.
+
+        Returns:
+            Optional[List[Dict[str, str]]]: The cached articles, or None if there are none.
+        """
+        cached = self._cache.get(include_details)
+        if cached is not None:
+            fetched_at, articles = cached
+            if self.cache_ttl is None or time.monotonic() - fetched_at < self.cache_ttl:
+                return articles
+        return None
+
+    def invalidate(self) -> None:
+        """Drop the cached articles so the next call fetches the feed again."""
+        self._cache.clear()
+
+    @staticmethod
+    def fetch_many(presenters: List["RSSPresenter"], include_details: bool = False,
+                   max_workers: Optional[int] = None) -> None:
+        """
+        Fetch the feeds of several presenters concurrently and cache the results.
+
+        Subsequent presenter calls with the same include_details reuse the cached
+        articles, so total fetch time is bounded by the slowest feed rather than
+        the sum of all feeds. Failed fetches are not cached; the presenter fetches
+        again (and reports the error) when it is used.
+
+        Args:
+            presenters (List[RSSPresenter]): Presenters whose feeds should be fetched.
+            include_details (bool): Whether to include summary and content.
+            max_workers (Optional[int]): Maximum number of concurrent fetches.
+                                         Defaults to RSSFetcher.MAX_CONCURRENT_FETCHES.
+        """
+        if not presenters:
+            return
+        results = RSSFetcher.fetch_all(
+            [presenter.fetcher for presenter in presenters],
+            max_workers or RSSFetcher.MAX_CONCURRENT_FETCHES,
+            include_details,
+        )
+        fetched_at = time.monotonic()
+        for presenter, articles in zip(presenters, results):
+            if not isinstance(articles, Exception):
+                presenter._cache[include_details] = (fetched_at, articles)
 
     def print_feed_summary(self, include_summary: bool = False) -> None:
         """
@@ -43,46 +127,54 @@ class RSSPresenter:
             include_summary (bool): Whether to include article summaries in the output.
                                   Defaults to False.
         """
-        articles = self.fetcher.fetch(include_details=include_summary)
+        articles = self._get_articles(include_summary)
             
         if not articles:
             print("[WARNING] No articles found in the feed.")
             return
 
-        print(f"[INFO] Found {len(articles)} articles in the feed.")
+        # build the whole listing first and write it to stdout once
+        lines = [f"[INFO] Found {len(articles)} articles in the feed."]
         
-        # print the first article's fields
-        if articles:
-            print("\nAvailable feed entry fields:")
-            print(", ".join(articles[0].keys()))
-            print("-" * 40)
+        # list the first article's fields
+        if self.verbose:
+            lines.append("\nAvailable feed entry fields:")
+            lines.append(", ".join(articles[0].keys()))
+        lines.append(_RULE)
         
         for article in articles:
-            self._print_article_summary(article, include_summary)
+            lines.extend(self._format_article_summary(article, include_summary))
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
-    def _print_article_summary(self, article: Dict[str, str], include_summary: bool) -> None:
+    def _format_article_summary(self, article: Dict[str, str], include_summary: bool) -> List[str]:
         """
-        Print summary information for a single article.
+        Format summary information for a single article.
 
         Args:
-            article (Dict[str, str]): The article data to print.
+            article (Dict[str, str]): The article data to format.
             include_summary (bool): Whether to include the article summary.
+
+        Returns:
+            List[str]: The output lines for the article.
         """
-        # print the current article's fields
-        print(f"Article fields: {', '.join(article.keys())}")
-        
-        print(f"Title: {article['title']}")
-        print(f"Link: {article['link']}")
-        print(f"Published: {article['published']}")
+        lines = []
+        # the current article's fields
+        if self.verbose:
+            lines.append(f"Article fields: {', '.join(article.keys())}")
+        lines.append(f"Title: {article['title']}")
+        lines.append(f"Link: {article['link']}")
+        lines.append(f"Published: {article['published']}")
         
         if include_summary and article.get('summary'):
             # Truncate summary if it's too long
             summary = article['summary']
             if len(summary) > 200:
                 summary = summary[:200] + "..."
-            print(f"Summary: {summary}")
+            lines.append(f"Summary: {summary}")
         
-        print("-" * 40)
+        lines.append(_RULE)
+        return lines
 
     def print_feed_statistics(self) -> Dict[str, int]:
         """
@@ -91,16 +183,22 @@ class RSSPresenter:
         Returns:
             Dict[str, int]: A dictionary containing feed statistics.
         """
-        articles = self.fetcher.fetch(include_details=True)
+        articles = self._get_articles(True)
         if not articles:
             print("[WARNING] No articles found in the feed.")
             return {"total_articles": 0}
 
-        # Calculate statistics
+        # Calculate statistics in a single pass over the articles
+        with_summary = with_content = 0
+        for article in articles:
+            if article.get('summary'):
+                with_summary += 1
+            if article.get('content'):
+                with_content += 1
         stats = {
             "total_articles": len(articles),
-            "articles_with_summary": sum(1 for a in articles if a.get('summary')),
-            "articles_with_content": sum(1 for a in articles if a.get('content')),
+            "articles_with_summary": with_summary,
+            "articles_with_content": with_content,
         }
 
         # Print statistics
@@ -121,16 +219,12 @@ class RSSPresenter:
         Returns:
             str: The article formatted as markdown.
         """
-        markdown = []
-        markdown.append(f"# {article['title']}\n")
-        markdown.append(f"Published: {article['published']}\n")
-        markdown.append(f"Link: {article['link']}\n")
-        
-        if article.get('summary'):
-            markdown.append("\n## Summary\n")
-            markdown.append(article['summary'])
-        
-        return "\n".join(markdown)
+        title = article['title']
+        link = article['link']
+        published = article['published']
+        summary = article.get('summary')
+        summary_block = f"\n\n## Summary\n\n{summary}" if summary else ""
+        return f"# {title}\n\nPublished: {published}\n\nLink: {link}\n{summary_block}"
 
     def export_to_markdown(self, output_path: str) -> bool:
         """
@@ -143,18 +237,24 @@ class RSSPresenter:
             bool: True if the export was successful, False otherwise.
         """
         try:
-            articles = self.fetcher.fetch(include_details=True)
-            if not articles:
+            # reuse cached articles if there are any, otherwise stream them from the
+            # feed so only one article is held in memory at a time
+            cached = self._cached_articles(True)
+            articles = iter(cached) if cached is not None else self.fetcher.iter_fetch(include_details=True)
+            first = next(articles, None)
+            if first is None:
                 print("[WARNING] No articles to export.")
                 return False
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(f"# Feed Contents\n\n")
-                f.write(f"Generated: {datetime.now().isoformat()}\n\n")
-                
-                for article in articles:
-                    f.write(self.format_article_as_markdown(article))
-                    f.write("\n\n---\n\n")
+            def chunks():
+                yield f"# Feed Contents\n\nGenerated: {datetime.now().isoformat()}\n\n"
+                for article in chain((first,), articles):
+                    yield self.format_article_as_markdown(article)
+                    yield _SEPARATOR
+
+            # the large buffer batches the per-article writes into few syscalls
+            with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.writelines(chunks())
 
             print(f"[INFO] Successfully exported feed to {output_path}")
             return True
@@ -6,6 +6,14 @@ including database connections and ORM models.
 """
 
 from src.forager.storage.base import BaseStorage, StorageError, SessionLocal
-from src.forager.storage.models import Base
+
+
+def __getattr__(name):
+    """Import the ORM models only when Base is first requested (PEP 562)."""
+    if name == "Base":
+        from src.forager.storage.models import Base
+        return Base
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["BaseStorage", "StorageError", "SessionLocal", "Base"]
\ No newline at end of file
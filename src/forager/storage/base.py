@@ -7,7 +7,7 @@ retrieving article data from various storage systems.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Iterable, Iterator, Optional, Any
 from datetime import datetime
 
 # Re-export SessionLocal for use in dependencies
@@ -74,6 +74,22 @@ class BaseStorage(ABC):
         """
         pass
 
+    @abstractmethod
+    def ensure_categories(self, names: Iterable[str]) -> Dict[str, int]:
+        """
+        Create any of the given categories that don't exist yet, in one transaction.
+
+        Args:
+            names: Category names.
+
+        Returns:
+            Mapping of every category name in storage to its ID.
+
+        Raises:
+            StorageError: If there is an error creating or retrieving the categories.
+        """
+        pass
+
     @abstractmethod
     def update_category(self, category_id: int, name: str) -> bool:
         """
@@ -153,6 +169,23 @@ class BaseStorage(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_feed_by_url(self, url: str, include_deleted: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Get a feed by its URL.
+
+        Args:
+            url: URL of the feed.
+            include_deleted: Whether to also match soft-deleted feeds.
+
+        Returns:
+            Feed data as a dict, or None if not found.
+
+        Raises:
+            StorageError: If there is an error retrieving the feed.
+        """
+        pass
+
     @abstractmethod
     def get_feeds(
         self,
@@ -188,7 +221,8 @@ class BaseStorage(ABC):
         Args:
             feed_id: ID of the feed to update.
             updates: Dict of fields to update and their new values.
-                    Can include: name, category_id, url, poll_interval, status.
+                    Can include: name, category_id, url, poll_interval, status,
+                    string_id, config_hash.
 
         Returns:
             True if the feed was updated, False if not found.
@@ -234,6 +268,47 @@ class BaseStorage(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_feed_cache_headers(self, feed_id: int) -> Dict[str, Optional[str]]:
+        """
+        Get the HTTP cache validators stored for a feed.
+
+        Args:
+            feed_id: ID of the feed.
+
+        Returns:
+            Dict with 'etag', 'last_modified' and 'content_hash' keys (values may be None).
+
+        Raises:
+            StorageError: If there is an error retrieving the validators.
+        """
+        pass
+
+    @abstractmethod
+    def update_feed_cache_headers(
+        self,
+        feed_id: int,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        content_hash: Optional[str] = None
+    ) -> bool:
+        """
+        Store the HTTP cache validators returned by the last successful fetch of a feed.
+
+        Args:
+            feed_id: ID of the feed.
+            etag: ETag response header, or None.
+            last_modified: Last-Modified response header, or None.
+            content_hash: Digest of the fetched feed body, or None.
+
+        Returns:
+            True if the feed was updated, False if not found.
+
+        Raises:
+            StorageError: If there is an error updating the feed.
+        """
+        pass
+
     # Tag management methods
     @abstractmethod
     def create_tag(self, name: str) -> int:
@@ -360,7 +435,7 @@ class BaseStorage(ABC):
             article: Article data as a dict with required fields:
                     - title: str
                     - link: str
-                    - published_at: datetime
+                    - published_at: datetime or ISO 8601 str (stored as ISO text)
                     - summary: Optional[str]
                     - content: Optional[str]
                     - status: str (default: 'new')
@@ -376,16 +451,24 @@ class BaseStorage(ABC):
         pass
 
     @abstractmethod
-    def save_articles(self, feed_id: int, articles: List[Dict[str, Any]]) -> List[int]:
+    def save_articles(self, feed_id: int, articles: Iterable[Dict[str, Any]]) -> List[int]:
         """
         Save multiple articles to storage.
 
+        Implementations must write each batch with a single multi-row statement
+        (e.g. executemany of INSERT OR IGNORE in SQLite, or SQLAlchemy Core
+        insert(...).on_conflict_do_nothing(index_elements=['link']) with
+        executemany_mode='values_plus_batch' on psycopg), not one save_article()
+        round trip per row.
+
         Args:
             feed_id: ID of the feed source.
-            articles: List of article dicts, each with required fields as in save_article().
+            articles: Iterable of article dicts, each with required fields as in save_article().
+                     Articles whose link already exists are skipped. Generators are
+                     consumed in batches, so the whole set need not be in memory.
 
         Returns:
-            List of IDs of the saved articles.
+            List of IDs of the newly saved articles.
 
         Raises:
             StorageError: If there is an error saving the articles.
@@ -437,13 +520,75 @@ class BaseStorage(ABC):
             include_deleted: Whether to include soft-deleted articles.
 
         Returns:
-            List of article dictionaries.
+            List of article dictionaries. Timestamps are returned as ISO 8601 strings.
 
         Raises:
             StorageError: If there is an error retrieving the articles.
         """
         pass
 
+    @abstractmethod
+    def iter_articles(
+        self,
+        feed_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+        tag_ids: Optional[List[int]] = None,
+        status: Optional[str] = None,
+        before_date: Optional[datetime] = None,
+        after_date: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        include_deleted: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream articles with the same filtering options as get_articles.
+
+        Rows are read from the backend in chunks, so memory use stays bounded
+        no matter how many articles match.
+
+        Args:
+            feed_id: Optional feed ID to filter by.
+            category_id: Optional category ID to filter by.
+            tag_ids: Optional list of tag IDs to filter by.
+            status: Optional status to filter by.
+            before_date: Optional datetime to get articles before.
+            after_date: Optional datetime to get articles after.
+            limit: Optional maximum number of articles to retrieve.
+            offset: Optional offset for pagination.
+            include_deleted: Whether to include soft-deleted articles.
+
+        Yields:
+            Article dictionaries.
+
+        Raises:
+            StorageError: If there is an error retrieving the articles.
+        """
+        pass
+
+    @abstractmethod
+    def search_articles(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        include_deleted: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Full-text search over article titles, summaries and content.
+
+        Args:
+            query: Search expression in the backend's full-text syntax
+                   (FTS5 MATCH syntax for SQLite).
+            limit: Optional maximum number of articles to retrieve.
+            include_deleted: Whether to include soft-deleted articles.
+
+        Returns:
+            List of article dictionaries, best matches first.
+
+        Raises:
+            StorageError: If there is an error searching the articles.
+        """
+        pass
+
     @abstractmethod
     def update_article(self, article_id: int, updates: Dict[str, Any]) -> bool:
         """
@@ -4,11 +4,15 @@ SQLAlchemy database configuration for the Forager application.
 This module sets up the SQLAlchemy engine and session factory.
 """
 
+import logging
 import os
 from pathlib import Path
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool, StaticPool
+
+logger = logging.getLogger(__name__)
 
 # Get database URL from environment variable, or use a default SQLite database path
 BASE_DIR = Path(__file__).resolve().parents[3]
@@ -18,27 +22,51 @@ DATABASE_URL = os.environ.get(
     f"sqlite:///{default_db_path}"
 )
 
-print(f"[DATABASE] Initializing database connection with URL: {DATABASE_URL}")
+logger.debug("Initializing database connection with URL: %s", DATABASE_URL)
+
+# Pick connection pool settings for the backend. SQLite allows a single writer, so a
+# large pool only adds lock contention; opening a SQLite connection is cheap.
+if DATABASE_URL.startswith("sqlite"):
+    pool_kwargs = {"poolclass": StaticPool if ":memory:" in DATABASE_URL else NullPool}
+else:
+    pool_kwargs = {
+        "pool_size": 20,              # Maximum number of connections to keep
+        "max_overflow": 10,           # Maximum number of connections to create beyond pool_size
+        "pool_timeout": 30,           # Seconds to wait before timeout on connection pool checkout
+        "pool_recycle": 1800,         # Seconds after which a connection is recycled
+        "pool_pre_ping": True,        # Enable connection health checks
+    }
 
 # Create SQLAlchemy engine with connection pool settings
 engine = create_engine(
     DATABASE_URL,
-    pool_size=20,                 # Maximum number of connections to keep
-    max_overflow=10,              # Maximum number of connections to create beyond pool_size
-    pool_timeout=30,              # Seconds to wait before timeout on connection pool checkout
-    pool_recycle=1800,            # Seconds after which a connection is recycled
-    pool_pre_ping=True,           # Enable connection health checks
-    connect_args={"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
+    connect_args={"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {},
+    **pool_kwargs
 )
 
-print(f"[DATABASE] SQLAlchemy engine created with pool_size={20}, max_overflow={10}")
+logger.debug("SQLAlchemy engine created with pool settings: %s", pool_kwargs)
+
+if DATABASE_URL.startswith("sqlite"):
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Use WAL so each commit no longer pays for a full fsync of the rollback journal."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB of memory-mapped reads
+        cursor.close()
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-print("[DATABASE] SessionLocal factory initialized")
+logger.debug("SessionLocal factory initialized")
 
-# Import models
-from src.forager.storage.models import Base
 
-print("[DATABASE] ORM models imported successfully") 
\ No newline at end of file
+# Import models lazily
+def __getattr__(name):
+    """Import the ORM models only when Base is first requested (PEP 562)."""
+    if name == "Base":
+        from src.forager.storage.models import Base
+        return Base
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
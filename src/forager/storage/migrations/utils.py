@@ -0,0 +1,77 @@
+"""
+Shared helpers for Alembic migration scripts.
+"""
+from typing import Callable
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.engine.reflection import Inspector
+
+
+def has_column(inspector: Inspector, table_name: str, column_name: str) -> bool:
+    """
+    Check if a column exists in the table.
+
+    The inspector caches reflection results, so a migration that builds one
+    inspector and checks several columns issues a single PRAGMA table_info.
+
+    Args:
+        inspector (Inspector): Inspector for the migration's connection
+        table_name (str): Table to look in
+        column_name (str): Column to look for
+
+    Returns:
+        bool: True if the column exists
+    """
+    return column_name in {c["name"] for c in inspector.get_columns(table_name)}
+
+
+def has_index(inspector: Inspector, table_name: str, index_name: str) -> bool:
+    """
+    Check if an index exists on the table.
+
+    Args:
+        inspector (Inspector): Inspector for the migration's connection
+        table_name (str): Table to look in
+        index_name (str): Index to look for
+
+    Returns:
+        bool: True if the index exists
+    """
+    return index_name in {idx["name"] for idx in inspector.get_indexes(table_name)}
+
+
+def batched_update(
+    table_name: str,
+    fn: Callable[[sa.engine.Connection, int, int], None],
+    pk: str = 'id',
+    batch_size: int = 1000,
+) -> None:
+    """
+    Apply a data rewrite to a large table in primary-key ranges.
+
+    Each batch is located with ``WHERE pk > :last_id ORDER BY pk LIMIT :batch``,
+    which uses the primary key index instead of scanning past a growing OFFSET,
+    and runs in its own autocommit block so locks are held for one batch only.
+
+    Args:
+        table_name (str): Table to rewrite
+        fn (Callable[[Connection, int, int], None]): Called as fn(bind, low, high) for
+            each batch; it should only touch rows with low < pk <= high
+        pk (str): Integer primary key column. Defaults to 'id'.
+        batch_size (int): Maximum number of rows per batch. Defaults to 1000.
+    """
+    bind = op.get_bind()
+    select_upper = sa.text(
+        f"SELECT MAX({pk}) FROM ("
+        f"SELECT {pk} FROM {table_name} WHERE {pk} > :last_id ORDER BY {pk} LIMIT :batch"
+        f")"
+    )
+    last_id = 0
+    while True:
+        with op.get_context().autocommit_block():
+            high = bind.execute(select_upper, {"last_id": last_id, "batch": batch_size}).scalar()
+            if high is None:
+                break
+            fn(bind, last_id, high)
+        last_id = high
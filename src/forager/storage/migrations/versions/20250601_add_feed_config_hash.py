@@ -0,0 +1,34 @@
+"""Add config_hash to rss_feeds
+
+Revision ID: 20250601_add_feed_config_hash
+Revises: 20250522_add_feed_string_id
+Create Date: 2025-06-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.engine.reflection import Inspector
+
+from src.forager.storage.migrations.utils import has_column
+
+
+# revision identifiers, used by Alembic.
+revision = '20250601_add_feed_config_hash'
+down_revision = '20250522_add_feed_string_id'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    inspector = Inspector.from_engine(op.get_bind())
+
+    # Hash of the feed's config entry, used by ConfigSynchronizer to skip unchanged feeds
+    if not has_column(inspector, 'rss_feeds', 'config_hash'):
+        op.add_column('rss_feeds', sa.Column('config_hash', sa.String(16), nullable=True))
+
+
+def downgrade() -> None:
+    inspector = Inspector.from_engine(op.get_bind())
+
+    if has_column(inspector, 'rss_feeds', 'config_hash'):
+        op.drop_column('rss_feeds', 'config_hash')
@@ -0,0 +1,38 @@
+"""Add HTTP cache validators (etag, last_modified) to rss_feeds
+
+Revision ID: 20250605_add_feed_cache_headers
+Revises: 20250601_add_feed_config_hash
+Create Date: 2025-06-05 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.engine.reflection import Inspector
+
+from src.forager.storage.migrations.utils import has_column
+
+
+# revision identifiers, used by Alembic.
+revision = '20250605_add_feed_cache_headers'
+down_revision = '20250601_add_feed_config_hash'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    inspector = Inspector.from_engine(op.get_bind())
+
+    # ETag / Last-Modified from the last successful poll, sent back as conditional GET headers
+    if not has_column(inspector, 'rss_feeds', 'etag'):
+        op.add_column('rss_feeds', sa.Column('etag', sa.Text(), nullable=True))
+    if not has_column(inspector, 'rss_feeds', 'last_modified'):
+        op.add_column('rss_feeds', sa.Column('last_modified', sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    inspector = Inspector.from_engine(op.get_bind())
+
+    if has_column(inspector, 'rss_feeds', 'last_modified'):
+        op.drop_column('rss_feeds', 'last_modified')
+    if has_column(inspector, 'rss_feeds', 'etag'):
+        op.drop_column('rss_feeds', 'etag')
@@ -0,0 +1,34 @@
+"""Add content_hash to rss_feeds
+
+Revision ID: 20250606_add_feed_content_hash
+Revises: 20250605_add_feed_cache_headers
+Create Date: 2025-06-06 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.engine.reflection import Inspector
+
+from src.forager.storage.migrations.utils import has_column
+
+
+# revision identifiers, used by Alembic.
+revision = '20250606_add_feed_content_hash'
+down_revision = '20250605_add_feed_cache_headers'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    inspector = Inspector.from_engine(op.get_bind())
+
+    # Digest of the last fetched feed body, used to skip parsing identical responses
+    if not has_column(inspector, 'rss_feeds', 'content_hash'):
+        op.add_column('rss_feeds', sa.Column('content_hash', sa.String(32), nullable=True))
+
+
+def downgrade() -> None:
+    inspector = Inspector.from_engine(op.get_bind())
+
+    if has_column(inspector, 'rss_feeds', 'content_hash'):
+        op.drop_column('rss_feeds', 'content_hash')
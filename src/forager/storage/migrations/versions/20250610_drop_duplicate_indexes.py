@@ -0,0 +1,48 @@
+"""Drop indexes duplicated by UNIQUE constraints and primary keys
+
+Revision ID: 20250610_drop_duplicate_indexes
+Revises: 20250606_add_feed_content_hash
+Create Date: 2025-06-10 00:00:00.000000
+
+"""
+from alembic import op
+from sqlalchemy.engine.reflection import Inspector
+
+from src.forager.storage.migrations.utils import has_index
+
+
+# revision identifiers, used by Alembic.
+revision = '20250610_drop_duplicate_indexes'
+down_revision = '20250606_add_feed_content_hash'
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, column) for plain indexes whose column is already the key
+# (or leading key) of an automatic index SQLite builds for a UNIQUE constraint
+# or a composite primary key
+DUPLICATE_INDEXES = [
+    ('ix_categories_name', 'categories', 'name'),
+    ('ix_tags_name', 'tags', 'name'),
+    ('ix_rss_feeds_url', 'rss_feeds', 'url'),
+    ('ix_rss_articles_link', 'rss_articles', 'link'),
+    ('ix_feed_tags_feed_id', 'feed_tags', 'feed_id'),
+    ('ix_articles_tags_article_id', 'articles_tags', 'article_id'),
+]
+
+
+def upgrade() -> None:
+    inspector = Inspector.from_engine(op.get_bind())
+
+    # Every insert and update paid for a second B-tree with the same keys
+    for index_name, table_name, _ in DUPLICATE_INDEXES:
+        if has_index(inspector, table_name, index_name):
+            op.drop_index(index_name, table_name=table_name)
+
+
+def downgrade() -> None:
+    inspector = Inspector.from_engine(op.get_bind())
+
+    for index_name, table_name, column_name in DUPLICATE_INDEXES:
+        if not has_index(inspector, table_name, index_name):
+            op.create_index(index_name, table_name, [column_name])
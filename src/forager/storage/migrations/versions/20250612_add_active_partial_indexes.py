@@ -0,0 +1,63 @@
+"""Replace deleted_at indexes with partial indexes on active rows
+
+Revision ID: 20250612_add_active_partial_indexes
+Revises: 20250610_drop_duplicate_indexes
+Create Date: 2025-06-12 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.engine.reflection import Inspector
+
+from src.forager.storage.migrations.utils import has_index
+
+
+# revision identifiers, used by Alembic.
+revision = '20250612_add_active_partial_indexes'
+down_revision = '20250610_drop_duplicate_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    inspector = Inspector.from_engine(op.get_bind())
+
+    # Listing queries filter on deleted_at IS NULL; partial indexes hold only the
+    # active rows, so they stay small and serve that filter and the date ordering
+    if not has_index(inspector, 'rss_articles', 'ix_rss_articles_active'):
+        op.create_index(
+            'ix_rss_articles_active', 'rss_articles', ['feed_id', 'published_at'],
+            sqlite_where=sa.text('deleted_at IS NULL')
+        )
+    if not has_index(inspector, 'rss_articles', 'ix_rss_articles_active_published'):
+        op.create_index(
+            'ix_rss_articles_active_published', 'rss_articles', ['published_at'],
+            sqlite_where=sa.text('deleted_at IS NULL')
+        )
+    if not has_index(inspector, 'rss_feeds', 'ix_rss_feeds_active'):
+        op.create_index(
+            'ix_rss_feeds_active', 'rss_feeds', ['category_id', 'status'],
+            sqlite_where=sa.text('deleted_at IS NULL')
+        )
+
+    # Full indexes over deleted_at are mostly NULL entries and no longer needed
+    if has_index(inspector, 'rss_articles', 'ix_rss_articles_deleted_at'):
+        op.drop_index('ix_rss_articles_deleted_at', table_name='rss_articles')
+    if has_index(inspector, 'rss_feeds', 'ix_rss_feeds_deleted_at'):
+        op.drop_index('ix_rss_feeds_deleted_at', table_name='rss_feeds')
+
+
+def downgrade() -> None:
+    inspector = Inspector.from_engine(op.get_bind())
+
+    if not has_index(inspector, 'rss_feeds', 'ix_rss_feeds_deleted_at'):
+        op.create_index('ix_rss_feeds_deleted_at', 'rss_feeds', ['deleted_at'])
+    if not has_index(inspector, 'rss_articles', 'ix_rss_articles_deleted_at'):
+        op.create_index('ix_rss_articles_deleted_at', 'rss_articles', ['deleted_at'])
+
+    if has_index(inspector, 'rss_feeds', 'ix_rss_feeds_active'):
+        op.drop_index('ix_rss_feeds_active', table_name='rss_feeds')
+    if has_index(inspector, 'rss_articles', 'ix_rss_articles_active_published'):
+        op.drop_index('ix_rss_articles_active_published', table_name='rss_articles')
+    if has_index(inspector, 'rss_articles', 'ix_rss_articles_active'):
+        op.drop_index('ix_rss_articles_active', table_name='rss_articles')
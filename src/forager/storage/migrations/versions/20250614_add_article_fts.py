@@ -0,0 +1,58 @@
+"""Add FTS5 full-text index over article title, summary and content
+
+Revision ID: 20250614_add_article_fts
+Revises: 20250612_add_active_partial_indexes
+Create Date: 2025-06-14 00:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20250614_add_article_fts'
+down_revision = '20250612_add_active_partial_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # External-content table: the index references rss_articles rows instead of
+    # keeping a second copy of the text
+    op.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS rss_articles_fts USING fts5("
+        "title, summary, content, content='rss_articles', content_rowid='id')"
+    )
+
+    # Keep the index in step with rss_articles
+    op.execute(
+        "CREATE TRIGGER IF NOT EXISTS rss_articles_fts_ai AFTER INSERT ON rss_articles BEGIN "
+        "INSERT INTO rss_articles_fts(rowid, title, summary, content) "
+        "VALUES (new.id, new.title, new.summary, new.content); "
+        "END"
+    )
+    op.execute(
+        "CREATE TRIGGER IF NOT EXISTS rss_articles_fts_ad AFTER DELETE ON rss_articles BEGIN "
+        "INSERT INTO rss_articles_fts(rss_articles_fts, rowid, title, summary, content) "
+        "VALUES ('delete', old.id, old.title, old.summary, old.content); "
+        "END"
+    )
+    # Only text changes need reindexing, not status or deleted_at updates
+    op.execute(
+        "CREATE TRIGGER IF NOT EXISTS rss_articles_fts_au "
+        "AFTER UPDATE OF title, summary, content ON rss_articles BEGIN "
+        "INSERT INTO rss_articles_fts(rss_articles_fts, rowid, title, summary, content) "
+        "VALUES ('delete', old.id, old.title, old.summary, old.content); "
+        "INSERT INTO rss_articles_fts(rowid, title, summary, content) "
+        "VALUES (new.id, new.title, new.summary, new.content); "
+        "END"
+    )
+
+    # Index the articles that already exist
+    op.execute("INSERT INTO rss_articles_fts(rss_articles_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS rss_articles_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS rss_articles_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS rss_articles_fts_ai")
+    op.execute("DROP TABLE IF EXISTS rss_articles_fts")
@@ -0,0 +1,56 @@
+"""Add composite indexes for the status and tag filters of get_articles
+
+Revision ID: 20250616_add_article_filter_indexes
+Revises: 20250614_add_article_fts
+Create Date: 2025-06-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.engine.reflection import Inspector
+
+from src.forager.storage.migrations.utils import has_index
+
+
+# revision identifiers, used by Alembic.
+revision = '20250616_add_article_filter_indexes'
+down_revision = '20250614_add_article_fts'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    inspector = Inspector.from_engine(op.get_bind())
+
+    # Status filters on active articles become a range scan already in published_at
+    # order, instead of a status lookup followed by a sort
+    if not has_index(inspector, 'rss_articles', 'ix_rss_articles_active_status'):
+        op.create_index(
+            'ix_rss_articles_active_status', 'rss_articles', ['status', 'published_at'],
+            sqlite_where=sa.text('deleted_at IS NULL')
+        )
+    if has_index(inspector, 'rss_articles', 'ix_rss_articles_status'):
+        op.drop_index('ix_rss_articles_status', table_name='rss_articles')
+
+    # Tag lookups read article ids straight from the index instead of the table
+    if not has_index(inspector, 'articles_tags', 'ix_articles_tags_tag_article'):
+        op.create_index('ix_articles_tags_tag_article', 'articles_tags', ['tag_id', 'article_id'])
+    if has_index(inspector, 'articles_tags', 'ix_articles_tags_tag_id'):
+        op.drop_index('ix_articles_tags_tag_id', table_name='articles_tags')
+
+    # Refresh planner statistics so the new indexes are chosen
+    op.execute("ANALYZE")
+
+
+def downgrade() -> None:
+    inspector = Inspector.from_engine(op.get_bind())
+
+    if not has_index(inspector, 'articles_tags', 'ix_articles_tags_tag_id'):
+        op.create_index('ix_articles_tags_tag_id', 'articles_tags', ['tag_id'])
+    if has_index(inspector, 'articles_tags', 'ix_articles_tags_tag_article'):
+        op.drop_index('ix_articles_tags_tag_article', table_name='articles_tags')
+
+    if not has_index(inspector, 'rss_articles', 'ix_rss_articles_status'):
+        op.create_index('ix_rss_articles_status', 'rss_articles', ['status'])
+    if has_index(inspector, 'rss_articles', 'ix_rss_articles_active_status'):
+        op.drop_index('ix_rss_articles_active_status', table_name='rss_articles')
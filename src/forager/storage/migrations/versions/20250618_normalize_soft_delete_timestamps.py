@@ -0,0 +1,56 @@
+"""Rewrite local isoformat deleted_at and last_error_at values as UTC timestamps
+
+Revision ID: 20250618_normalize_soft_delete_timestamps
+Revises: 20250616_add_article_filter_indexes
+Create Date: 2025-06-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from src.forager.storage.migrations.utils import batched_update
+
+
+# revision identifiers, used by Alembic.
+revision = '20250618_normalize_soft_delete_timestamps'
+down_revision = '20250616_add_article_filter_indexes'
+branch_labels = None
+depends_on = None
+
+# Columns that used to be written with datetime.now().isoformat() (naive local
+# time, 'T' separator) and are now written in CURRENT_TIMESTAMP form (UTC,
+# 'YYYY-MM-DD HH:MM:SS')
+_TIMESTAMP_COLUMNS = {
+    'rss_feeds': ('deleted_at', 'last_error_at'),
+    'rss_articles': ('deleted_at',),
+}
+
+
+def _normalize(table_name: str, column_name: str):
+    """Build a batched_update callback converting one column's old-form values."""
+    # Only values with the 'T' separator are in the old form; SQLite's 'utc' modifier
+    # reads them as local time of this machine, which is where they were written.
+    # Values datetime() cannot parse are left as they are rather than nulled.
+    statement = sa.text(
+        f"UPDATE {table_name} SET {column_name} = datetime({column_name}, 'utc') "
+        f"WHERE id > :low AND id <= :high "
+        f"AND {column_name} LIKE '____-__-__T%' "
+        f"AND datetime({column_name}, 'utc') IS NOT NULL"
+    )
+
+    def rewrite(bind, low: int, high: int) -> None:
+        bind.execute(statement, {"low": low, "high": high})
+
+    return rewrite
+
+
+def upgrade() -> None:
+    for table_name, column_names in _TIMESTAMP_COLUMNS.items():
+        for column_name in column_names:
+            batched_update(table_name, _normalize(table_name, column_name))
+
+
+def downgrade() -> None:
+    # The original local-time values can't be told apart from ones written in UTC
+    # since, and both forms sort correctly on their own, so leave the data as is
+    pass
@@ -75,6 +75,10 @@ class RSSFeed(Base):
     last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     last_error_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    config_hash: Mapped[Optional[str]] = mapped_column(String(16), nullable=True)
+    etag: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    last_modified: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    content_hash: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
 
     # Relationships
     category: Mapped['Category'] = relationship(back_populates='feeds')
@@ -5,23 +5,256 @@ SQLite storage backend for persisting RSS articles.
 import sqlite3
 import logging
 import json
+import functools
+import hashlib
+import re
+import threading
+from itertools import chain, islice
 from pathlib import Path
-from typing import List, Dict, Optional, Any
-from datetime import datetime
+from typing import List, Dict, Iterable, Iterator, Optional, Any
+from datetime import datetime, timezone
 import inspect
 
-from alembic.config import Config
-from alembic import command
 from forager.storage.base import BaseStorage, StorageError
 
+try:
+    import orjson
+
+    def _dumps_json(value: Any) -> str:
+        """Serialize manual_labels with orjson, accepting non-string keys like json.dumps."""
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _loads_json = orjson.loads
+except ImportError:
+    _dumps_json = json.dumps
+    _loads_json = json.loads
+
 logger = logging.getLogger(__name__)
 
+# SQL text for the hot paths. Keeping these as constants gives sqlite3's
+# per-connection statement cache a stable key, so each is prepared only once.
+_SQL_CREATE_CATEGORY = "INSERT INTO categories (name) VALUES (?)"
+_SQL_ENSURE_CATEGORY = "INSERT OR IGNORE INTO categories (name) VALUES (?)"
+_SQL_SELECT_CATEGORIES = "SELECT id, name, created_at, updated_at FROM categories"
+_SQL_SELECT_CATEGORY = _SQL_SELECT_CATEGORIES + " WHERE id = ?"
+_SQL_CATEGORY_IDS = "SELECT id, name FROM categories"
+_SQL_UPDATE_CATEGORY = "UPDATE categories SET name = ? WHERE id = ?"
+_SQL_DELETE_CATEGORY = "DELETE FROM categories WHERE id = ?"
+_SQL_CREATE_FEED = """
+    INSERT INTO rss_feeds
+    (category_id, name, url, poll_interval, status)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_SQL_SELECT_FEEDS = """
+    SELECT id, category_id, name, url, poll_interval, status,
+           created_at, updated_at, last_error, last_error_at, deleted_at, string_id,
+           config_hash, etag, last_modified, content_hash
+    FROM rss_feeds
+"""
+_SQL_SELECT_FEED = _SQL_SELECT_FEEDS + " WHERE id = ?"
+_SQL_SELECT_FEED_BY_URL = _SQL_SELECT_FEEDS + " WHERE url = ? LIMIT 1"
+_SQL_SELECT_ACTIVE_FEED_BY_URL = _SQL_SELECT_FEEDS + " WHERE url = ? AND deleted_at IS NULL LIMIT 1"
+_SQL_DELETE_FEED = "DELETE FROM rss_feeds WHERE id = ?"
+_SQL_SOFT_DELETE_FEED = "UPDATE rss_feeds SET deleted_at = ? WHERE id = ?"
+_SQL_UPDATE_FEED_ERROR = "UPDATE rss_feeds SET last_error = ?, last_error_at = ? WHERE id = ?"
+_SQL_SELECT_FEED_CACHE_HEADERS = "SELECT etag, last_modified, content_hash FROM rss_feeds WHERE id = ?"
+_SQL_UPDATE_FEED_CACHE_HEADERS = (
+    "UPDATE rss_feeds SET etag = ?, last_modified = ?, content_hash = ? WHERE id = ?"
+)
+# Columns update_feed may set; any other key in the updates dict is ignored
+_FEED_UPDATABLE = frozenset({'name', 'category_id', 'url', 'poll_interval', 'status', 'string_id', 'config_hash'})
+_SQL_CREATE_TAG = "INSERT INTO tags (name) VALUES (?)"
+_SQL_SELECT_TAGS = "SELECT id, name, created_at, updated_at FROM tags"
+_SQL_SELECT_TAG = _SQL_SELECT_TAGS + " WHERE id = ?"
+_SQL_UPDATE_TAG = "UPDATE tags SET name = ? WHERE id = ?"
+_SQL_DELETE_TAG = "DELETE FROM tags WHERE id = ?"
+_SQL_ADD_TAG_TO_FEED = "INSERT OR IGNORE INTO feed_tags (feed_id, tag_id) VALUES (?, ?)"
+_SQL_REMOVE_TAG_FROM_FEED = "DELETE FROM feed_tags WHERE feed_id = ? AND tag_id = ?"
+_SQL_INSERT_ARTICLE = """
+    INSERT INTO rss_articles
+    (feed_id, title, link, published_at, status, summary, content, manual_labels)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+# Columns update_article may set; any other key in the updates dict is ignored
+_ARTICLE_UPDATABLE = frozenset({'title', 'link', 'status', 'summary', 'content', 'manual_labels'})
+# Per-connection settings applied when a connection is opened. With WAL,
+# synchronous=NORMAL never corrupts the database; a power loss can only drop the
+# most recent commits, and commits no longer fsync every time.
+_CONNECTION_PRAGMAS = """
+    PRAGMA foreign_keys = ON;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -65536;      -- ~64MB page cache (negative values are in KiB)
+    PRAGMA mmap_size = 268435456;    -- 256MB of memory-mapped reads
+    PRAGMA busy_timeout = 5000;      -- wait up to 5s for another writer's lock
+"""
+# Multi-row form for save_articles; formatted with one placeholder group per article
+_SQL_INSERT_OR_IGNORE_ARTICLES = """
+    INSERT OR IGNORE INTO rss_articles
+    (feed_id, title, link, published_at, status, summary, content, manual_labels)
+    VALUES {values}
+"""
+_ARTICLE_PLACEHOLDERS = "(?, ?, ?, ?, ?, ?, ?, ?)"
+_ARTICLE_PARAM_COUNT = 8
+# RETURNING needs SQLite 3.35+; older libraries fall back to a MAX(id) lookup
+_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+_SQL_MAX_ARTICLE_ID = "SELECT COALESCE(MAX(id), 0) FROM rss_articles"
+_SQL_ARTICLE_IDS_AFTER = "SELECT id FROM rss_articles WHERE id > ? ORDER BY id"
+_SQL_SELECT_ARTICLE = """
+    SELECT id, feed_id, title, link, published_at, fetched_at, updated_at,
+           status, summary, content, deleted_at, manual_labels
+    FROM rss_articles WHERE id = ?
+"""
+_SQL_SELECT_ARTICLES = """
+    SELECT a.id, a.feed_id, a.title, a.link, a.published_at,
+           a.fetched_at, a.updated_at, a.status, a.summary, a.content,
+           a.deleted_at, a.manual_labels
+    FROM rss_articles a
+"""
+_SQL_SEARCH_ARTICLES = """
+    SELECT a.id, a.feed_id, a.title, a.link, a.published_at,
+           a.fetched_at, a.updated_at, a.status, a.summary, a.content,
+           a.deleted_at, a.manual_labels
+    FROM rss_articles_fts
+    JOIN rss_articles a ON a.id = rss_articles_fts.rowid
+    WHERE rss_articles_fts MATCH ?
+"""
+_SQL_DELETE_ARTICLE = "DELETE FROM rss_articles WHERE id = ?"
+_SQL_SOFT_DELETE_ARTICLE = "UPDATE rss_articles SET deleted_at = ? WHERE id = ?"
+_SQL_ADD_TAG_TO_ARTICLE = "INSERT OR IGNORE INTO articles_tags (article_id, tag_id) VALUES (?, ?)"
+_SQL_REMOVE_TAG_FROM_ARTICLE = "DELETE FROM articles_tags WHERE article_id = ? AND tag_id = ?"
+
+
+@functools.lru_cache(maxsize=8)
+def _insert_articles_sql(row_count: int) -> str:
+    """Build the multi-row article INSERT for row_count articles (full chunks reuse one string)."""
+    sql = _SQL_INSERT_OR_IGNORE_ARTICLES.format(values=", ".join([_ARTICLE_PLACEHOLDERS] * row_count))
+    return sql + "    RETURNING id\n" if _SUPPORTS_RETURNING else sql
+
+
+@functools.lru_cache(maxsize=64)
+def _feeds_query(by_category: bool, by_status: bool, include_deleted: bool) -> str:
+    """Compose the get_feeds query for the enabled filters (built once per combination)."""
+    query = _SQL_SELECT_FEEDS + " WHERE 1=1"
+    if by_category:
+        query += " AND category_id = ?"
+    if by_status:
+        query += " AND status = ?"
+    if not include_deleted:
+        query += " AND deleted_at IS NULL"
+    return query
+
+
+@functools.lru_cache(maxsize=256)
+def _articles_query(
+    by_feed: bool,
+    by_category: bool,
+    tag_count: int,
+    by_status: bool,
+    before: bool,
+    after: bool,
+    include_deleted: bool,
+    limited: bool,
+    offset: bool
+) -> str:
+    """Compose the iter_articles query for the enabled filters (built once per combination)."""
+    query = _SQL_SELECT_ARTICLES
+    # Join feeds only when filtering by category, so other queries read one table
+    if by_category:
+        query += " JOIN rss_feeds f ON a.feed_id = f.id"
+    query += " WHERE 1=1"
+    if by_feed:
+        query += " AND a.feed_id = ?"
+    if by_category:
+        query += " AND f.category_id = ?"
+    if tag_count:
+        # A semi-join stops at the first matching tag, so no DISTINCT is needed
+        query += (
+            " AND EXISTS (SELECT 1 FROM articles_tags at WHERE at.article_id = a.id"
+            f" AND at.tag_id IN ({','.join('?' * tag_count)}))"
+        )
+    if by_status:
+        query += " AND a.status = ?"
+    if before:
+        query += " AND a.published_at < ?"
+    if after:
+        query += " AND a.published_at > ?"
+    if not include_deleted:
+        query += " AND a.deleted_at IS NULL"
+    query += " ORDER BY a.published_at DESC"
+    if limited:
+        query += " LIMIT ?"
+    if offset:
+        query += " OFFSET ?"
+    return query
+
+
+_REVISION_LINE = re.compile(r"^(revision|down_revision)\s*=\s*['\"]([^'\"]+)['\"]", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=1)
+def _schema_version() -> int:
+    """
+    Stable 31-bit hash of the Alembic head revision id.
+
+    Recorded in PRAGMA user_version once the schema is at head, so any new head
+    revision moves it off the value stamped in existing databases. The head is
+    found by reading the revision lines of migrations/versions directly, since
+    importing Alembic here would cost more than the upgrade check it gates.
+    """
+    revisions, parents = set(), set()
+    versions_dir = Path(__file__).parent / "migrations" / "versions"
+    for path in versions_dir.glob("*.py"):
+        if path.name.startswith("_"):
+            continue
+        for name, value in _REVISION_LINE.findall(path.read_text(encoding="utf-8")):
+            (revisions if name == "revision" else parents).add(value)
+    head = ",".join(sorted(revisions - parents))
+    return int.from_bytes(hashlib.blake2b(head.encode(), digest_size=4).digest(), "big") & 0x7FFFFFFF
+
+
+def _utcnow_timestamp() -> str:
+    """
+    Current UTC time for deleted_at and last_error_at.
+
+    Uses the same 'YYYY-MM-DD HH:MM:SS' form as SQLite's CURRENT_TIMESTAMP, so these
+    columns sort and compare like fetched_at. Older rows written as naive local
+    isoformat() are rewritten to this form by the 20250618 migration.
+    """
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _to_db_timestamp(value: Any) -> Any:
+    """
+    Format a datetime as the ISO text stored in timestamp columns.
+
+    Matches what sqlite3's deprecated default datetime adapter wrote, but without
+    the per-value adapter lookup; strings and None pass through unchanged.
+    """
+    return value.isoformat(" ") if isinstance(value, datetime) else value
+
+
+def _article_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    """Convert an rss_articles row to a dict, decoding the JSON manual_labels column."""
+    article = dict(row)
+    labels = article["manual_labels"]
+    article["manual_labels"] = _loads_json(labels) if labels else None
+    return article
+
+
 class SQLiteStorage(BaseStorage):
     """
     SQLite implementation of BaseStorage.
     Stores articles in a local SQLite database.
     """
 
+    # Number of articles written per transaction by save_articles
+    SAVE_BATCH_SIZE = 500
+    # Number of rows fetched per round trip by iter_articles
+    FETCH_BATCH_SIZE = 512
+    # Number of articles removed per transaction by delete_articles
+    DELETE_BATCH_SIZE = 1000
+
     def __init__(self, db_path: Path):
         """
         Initialize the SQLite connection and ensure database is up to date.
@@ -30,11 +263,25 @@ class SQLiteStorage(BaseStorage):
             db_path: path to the SQLite .db file.
         """
         self.db_path = db_path
-        self._conn = None
+        # One connection per thread; WAL lets their reads run alongside a writer
+        self._local = threading.local()
+        # Every connection opened so far, so close() can reach other threads' ones
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
         self._run_migrations()
 
     def _run_migrations(self) -> None:
         """Run database migrations using Alembic."""
+        # A database stamped with the current schema version needs no Alembic at all
+        schema_version = _schema_version()
+        if self._get_connection().execute("PRAGMA user_version").fetchone()[0] == schema_version:
+            return
+
+        # Imported here so up-to-date databases never load Alembic
+        from alembic import command
+        from alembic.config import Config
+        from alembic.script import ScriptDirectory
+
         try:
             # Ensure migrations directory exists
             migrations_dir = Path(__file__).parent / "migrations"
@@ -46,28 +293,55 @@ class SQLiteStorage(BaseStorage):
             alembic_cfg.set_main_option("script_location", str(migrations_dir))
             alembic_cfg.set_main_option("sqlalchemy.url", f"sqlite:///{self.db_path}")
 
-            # Run migrations
-            command.upgrade(alembic_cfg, "head")
+            # command.upgrade loads the env and walks every revision even when there is
+            # nothing to do, so skip it when the stored version is already the head
+            if self._current_revision() != ScriptDirectory.from_config(alembic_cfg).get_current_head():
+                # Run migrations
+                command.upgrade(alembic_cfg, "head")
+
+            conn = self._get_connection()
+            conn.execute(f"PRAGMA user_version = {int(schema_version)}")
+            conn.commit()
         except Exception as e:
             raise StorageError(f"Failed to run database migrations: {e}")
 
+    def _current_revision(self) -> Optional[str]:
+        """Return the revision stored in alembic_version, or None for a new database."""
+        try:
+            row = self._get_connection().execute("SELECT version_num FROM alembic_version").fetchone()
+        except sqlite3.OperationalError:
+            # No alembic_version table yet
+            return None
+        return row[0] if row else None
+
     def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection."""
-        if self._conn is None:
-            self._conn = sqlite3.connect(self.db_path)
-            # Enable foreign keys
-            self._conn.execute("PRAGMA foreign_keys = ON")
-        return self._conn
+        """Get the calling thread's database connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # close() may run on another thread, so don't pin the connection to this one
+            # detect_types stays off: timestamps are written and returned as ISO text,
+            # so no per-value converters run on reads
+            conn = sqlite3.connect(
+                self.db_path, cached_statements=512, detect_types=0, check_same_thread=False
+            )
+            # Rows support both index and column-name access, so results convert
+            # to dicts in C via dict(row)
+            conn.row_factory = sqlite3.Row
+            # journal_mode is stored in the database file, so only switch it once
+            if conn.execute("PRAGMA journal_mode").fetchone()[0].lower() != "wal":
+                conn.execute("PRAGMA journal_mode = WAL")
+            conn.executescript(_CONNECTION_PRAGMAS)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
 
     # Category management methods
     def create_category(self, name: str) -> int:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    "INSERT INTO categories (name) VALUES (?)",
-                    (name,)
-                )
+                cursor.execute(_SQL_CREATE_CATEGORY, (name,))
                 conn.commit()
                 return cursor.lastrowid
         except sqlite3.Error as e:
@@ -77,18 +351,10 @@ class SQLiteStorage(BaseStorage):
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT id, name, created_at, updated_at FROM categories WHERE id = ?",
-                    (category_id,)
-                )
+                cursor.execute(_SQL_SELECT_CATEGORY, (category_id,))
                 row = cursor.fetchone()
                 if row:
-                    return {
-                        "id": row[0],
-                        "name": row[1],
-                        "created_at": row[2],
-                        "updated_at": row[3]
-                    }
+                    return dict(row)
                 return None
         except sqlite3.Error as e:
             raise StorageError(f"Failed to get category: {e}")
@@ -97,29 +363,29 @@ class SQLiteStorage(BaseStorage):
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT id, name, created_at, updated_at FROM categories"
-                )
-                return [
-                    {
-                        "id": row[0],
-                        "name": row[1],
-                        "created_at": row[2],
-                        "updated_at": row[3]
-                    }
-                    for row in cursor.fetchall()
-                ]
+                cursor.execute(_SQL_SELECT_CATEGORIES)
+                return [dict(row) for row in cursor.fetchall()]
         except sqlite3.Error as e:
             raise StorageError(f"Failed to get categories: {e}")
 
+    def ensure_categories(self, names: Iterable[str]) -> Dict[str, int]:
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                # Existing names are skipped by the unique index on categories.name
+                cursor.executemany(_SQL_ENSURE_CATEGORY, ((name,) for name in names))
+                cursor.execute(_SQL_CATEGORY_IDS)
+                category_map = {row[1]: row[0] for row in cursor.fetchall()}
+                conn.commit()
+                return category_map
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to ensure categories: {e}")
+
     def update_category(self, category_id: int, name: str) -> bool:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    "UPDATE categories SET name = ? WHERE id = ?",
-                    (name, category_id)
-                )
+                cursor.execute(_SQL_UPDATE_CATEGORY, (name, category_id))
                 conn.commit()
                 return cursor.rowcount > 0
         except sqlite3.Error as e:
@@ -129,10 +395,7 @@ class SQLiteStorage(BaseStorage):
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    "DELETE FROM categories WHERE id = ?",
-                    (category_id,)
-                )
+                cursor.execute(_SQL_DELETE_CATEGORY, (category_id,))
                 conn.commit()
                 return cursor.rowcount > 0
         except sqlite3.Error as e:
@@ -150,14 +413,7 @@ class SQLiteStorage(BaseStorage):
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    INSERT INTO rss_feeds 
-                    (category_id, name, url, poll_interval, status)
-                    VALUES (?, ?, ?, ?, ?)
-                    """,
-                    (category_id, name, url, poll_interval, status)
-                )
+                cursor.execute(_SQL_CREATE_FEED, (category_id, name, url, poll_interval, status))
                 conn.commit()
                 return cursor.lastrowid
         except sqlite3.Error as e:
@@ -167,34 +423,27 @@ class SQLiteStorage(BaseStorage):
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    SELECT id, category_id, name, url, poll_interval, status,
-                           created_at, updated_at, last_error, last_error_at, deleted_at, string_id
-                    FROM rss_feeds WHERE id = ?
-                    """,
-                    (feed_id,)
-                )
+                cursor.execute(_SQL_SELECT_FEED, (feed_id,))
                 row = cursor.fetchone()
                 if row:
-                    return {
-                        "id": row[0],
-                        "category_id": row[1],
-                        "name": row[2],
-                        "url": row[3],
-                        "poll_interval": row[4],
-                        "status": row[5],
-                        "created_at": row[6],
-                        "updated_at": row[7],
-                        "last_error": row[8],
-                        "last_error_at": row[9],
-                        "deleted_at": row[10],
-                        "string_id": row[11]
-                    }
+                    return dict(row)
                 return None
         except sqlite3.Error as e:
             raise StorageError(f"Failed to get feed: {e}")
 
+    def get_feed_by_url(self, url: str, include_deleted: bool = False) -> Optional[Dict[str, Any]]:
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                query = _SQL_SELECT_FEED_BY_URL if include_deleted else _SQL_SELECT_ACTIVE_FEED_BY_URL
+                cursor.execute(query, (url,))
+                row = cursor.fetchone()
+                if row:
+                    return dict(row)
+                return None
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to get feed by URL: {e}")
+
     def get_feeds(
         self,
         category_id: Optional[int] = None,
@@ -204,43 +453,17 @@ class SQLiteStorage(BaseStorage):
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                query = """
-                    SELECT id, category_id, name, url, poll_interval, status,
-                           created_at, updated_at, last_error, last_error_at, deleted_at, string_id
-                    FROM rss_feeds
-                    WHERE 1=1
-                """
                 params = []
                 
                 if category_id is not None:
-                    query += " AND category_id = ?"
                     params.append(category_id)
                 
                 if status is not None:
-                    query += " AND status = ?"
                     params.append(status)
                 
-                if not include_deleted:
-                    query += " AND deleted_at IS NULL"
-                
+                query = _feeds_query(category_id is not None, status is not None, include_deleted)
                 cursor.execute(query, params)
-                return [
-                    {
-                        "id": row[0],
-                        "category_id": row[1],
-                        "name": row[2],
-                        "url": row[3],
-                        "poll_interval": row[4],
-                        "status": row[5],
-                        "created_at": row[6],
-                        "updated_at": row[7],
-                        "last_error": row[8],
-                        "last_error_at": row[9],
-                        "deleted_at": row[10],
-                        "string_id": row[11]
-                    }
-                    for row in cursor.fetchall()
-                ]
+                return [dict(row) for row in cursor.fetchall()]
         except sqlite3.Error as e:
             raise StorageError(f"Failed to get feeds: {e}")
 
@@ -264,8 +487,6 @@ class SQLiteStorage(BaseStorage):
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                set_clauses = []
-                params = []
                 
                 # Print column names of the table if in debug mode
                 if debug:
@@ -277,20 +498,18 @@ class SQLiteStorage(BaseStorage):
                     except Exception as e:
                         print(f"[DEBUG SQL] Error getting table info: {e}")
                 
-                for key, value in updates.items():
-                    # Expand the list of allowed fields to include string_id
-                    if key in ['name', 'category_id', 'url', 'poll_interval', 'status', 'string_id']:
-                        set_clauses.append(f"{key} = ?")
-                        params.append(value)
-                        if debug:
-                            print(f"[DEBUG SQL] Adding update for {key}={value}")
+                pairs = [(key, value) for key, value in updates.items() if key in _FEED_UPDATABLE]
+                if debug:
+                    for key, value in pairs:
+                        print(f"[DEBUG SQL] Adding update for {key}={value}")
                 
-                if not set_clauses:
+                if not pairs:
                     if debug:
                         print(f"[DEBUG SQL] No valid fields to update")
                     return False
                 
-                query = f"UPDATE rss_feeds SET {', '.join(set_clauses)} WHERE id = ?"
+                query = f"UPDATE rss_feeds SET {', '.join(f'{key} = ?' for key, _ in pairs)} WHERE id = ?"
+                params = [value for _, value in pairs]
                 params.append(feed_id)
                 
                 if debug:
@@ -312,12 +531,9 @@ class SQLiteStorage(BaseStorage):
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 if hard_delete:
-                    cursor.execute("DELETE FROM rss_feeds WHERE id = ?", (feed_id,))
+                    cursor.execute(_SQL_DELETE_FEED, (feed_id,))
                 else:
-                    cursor.execute(
-                        "UPDATE rss_feeds SET deleted_at = ? WHERE id = ?",
-                        (datetime.now().isoformat(), feed_id)
-                    )
+                    cursor.execute(_SQL_SOFT_DELETE_FEED, (_utcnow_timestamp(), feed_id))
                 conn.commit()
                 return cursor.rowcount > 0
         except sqlite3.Error as e:
@@ -328,27 +544,48 @@ class SQLiteStorage(BaseStorage):
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
-                    """
-                    UPDATE rss_feeds 
-                    SET last_error = ?, last_error_at = ?
-                    WHERE id = ?
-                    """,
-                    (error, datetime.now().isoformat() if error else None, feed_id)
+                    _SQL_UPDATE_FEED_ERROR,
+                    (error, _utcnow_timestamp() if error else None, feed_id)
                 )
                 conn.commit()
                 return cursor.rowcount > 0
         except sqlite3.Error as e:
             raise StorageError(f"Failed to update feed error: {e}")
 
+    def get_feed_cache_headers(self, feed_id: int) -> Dict[str, Optional[str]]:
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(_SQL_SELECT_FEED_CACHE_HEADERS, (feed_id,))
+                row = cursor.fetchone()
+                if row:
+                    return dict(row)
+                return {"etag": None, "last_modified": None, "content_hash": None}
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to get feed cache headers: {e}")
+
+    def update_feed_cache_headers(
+        self,
+        feed_id: int,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        content_hash: Optional[str] = None
+    ) -> bool:
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(_SQL_UPDATE_FEED_CACHE_HEADERS, (etag, last_modified, content_hash, feed_id))
+                conn.commit()
+                return cursor.rowcount > 0
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to update feed cache headers: {e}")
+
     # Tag management methods
     def create_tag(self, name: str) -> int:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    "INSERT INTO tags (name) VALUES (?)",
-                    (name,)
-                )
+                cursor.execute(_SQL_CREATE_TAG, (name,))
                 conn.commit()
                 return cursor.lastrowid
         except sqlite3.Error as e:
@@ -358,18 +595,10 @@ class SQLiteStorage(BaseStorage):
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT id, name, created_at, updated_at FROM tags WHERE id = ?",
-                    (tag_id,)
-                )
+                cursor.execute(_SQL_SELECT_TAG, (tag_id,))
                 row = cursor.fetchone()
                 if row:
-                    return {
-                        "id": row[0],
-                        "name": row[1],
-                        "created_at": row[2],
-                        "updated_at": row[3]
-                    }
+                    return dict(row)
                 return None
         except sqlite3.Error as e:
             raise StorageError(f"Failed to get tag: {e}")
@@ -378,18 +607,8 @@ class SQLiteStorage(BaseStorage):
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT id, name, created_at, updated_at FROM tags"
-                )
-                return [
-                    {
-                        "id": row[0],
-                        "name": row[1],
-                        "created_at": row[2],
-                        "updated_at": row[3]
-                    }
-                    for row in cursor.fetchall()
-                ]
+                cursor.execute(_SQL_SELECT_TAGS)
+                return [dict(row) for row in cursor.fetchall()]
         except sqlite3.Error as e:
             raise StorageError(f"Failed to get tags: {e}")
 
@@ -397,10 +616,7 @@ class SQLiteStorage(BaseStorage):
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    "UPDATE tags SET name = ? WHERE id = ?",
-                    (name, tag_id)
-                )
+                cursor.execute(_SQL_UPDATE_TAG, (name, tag_id))
                 conn.commit()
                 return cursor.rowcount > 0
         except sqlite3.Error as e:
@@ -410,10 +626,7 @@ class SQLiteStorage(BaseStorage):
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    "DELETE FROM tags WHERE id = ?",
-                    (tag_id,)
-                )
+                cursor.execute(_SQL_DELETE_TAG, (tag_id,))
                 conn.commit()
                 return cursor.rowcount > 0
         except sqlite3.Error as e:
@@ -423,10 +636,7 @@ class SQLiteStorage(BaseStorage):
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    "INSERT OR IGNORE INTO feed_tags (feed_id, tag_id) VALUES (?, ?)",
-                    (feed_id, tag_id)
-                )
+                cursor.execute(_SQL_ADD_TAG_TO_FEED, (feed_id, tag_id))
                 conn.commit()
                 return cursor.rowcount > 0
         except sqlite3.Error as e:
@@ -436,10 +646,7 @@ class SQLiteStorage(BaseStorage):
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    "DELETE FROM feed_tags WHERE feed_id = ? AND tag_id = ?",
-                    (feed_id, tag_id)
-                )
+                cursor.execute(_SQL_REMOVE_TAG_FROM_FEED, (feed_id, tag_id))
                 conn.commit()
                 return cursor.rowcount > 0
         except sqlite3.Error as e:
@@ -451,20 +658,16 @@ class SQLiteStorage(BaseStorage):
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
-                    """
-                    INSERT INTO rss_articles 
-                    (feed_id, title, link, published_at, status, summary, content, manual_labels)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
+                    _SQL_INSERT_ARTICLE,
                     (
                         feed_id,
                         article["title"],
                         article["link"],
-                        article["published_at"],
+                        _to_db_timestamp(article["published_at"]),
                         article.get("status", "new"),
                         article.get("summary"),
                         article.get("content"),
-                        json.dumps(article.get("manual_labels")) if article.get("manual_labels") else None
+                        _dumps_json(article.get("manual_labels")) if article.get("manual_labels") else None
                     )
                 )
                 conn.commit()
@@ -472,64 +675,64 @@ class SQLiteStorage(BaseStorage):
         except sqlite3.Error as e:
             raise StorageError(f"Failed to save article: {e}")
 
-    def save_articles(self, feed_id: int, articles: List[Dict[str, Any]]) -> List[int]:
+    def save_articles(self, feed_id: int, articles: Iterable[Dict[str, Any]]) -> List[int]:
+        rows = (
+            (
+                feed_id,
+                article["title"],
+                article["link"],
+                _to_db_timestamp(article["published_at"]),
+                article.get("status", "new"),
+                article.get("summary"),
+                article.get("content"),
+                _dumps_json(article.get("manual_labels")) if article.get("manual_labels") else None
+            )
+            for article in articles
+        )
+        article_ids = []
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        # Pack as many rows into each INSERT as the library's bound-parameter limit allows
+        rows_per_statement = max(
+            1, conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER) // _ARTICLE_PARAM_COUNT
+        )
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                article_ids = []
-                for article in articles:
-                    cursor.execute(
-                        """
-                        INSERT OR IGNORE INTO rss_articles 
-                        (feed_id, title, link, published_at, status, summary, content, manual_labels)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            feed_id,
-                            article["title"],
-                            article["link"],
-                            article["published_at"],
-                            article.get("status", "new"),
-                            article.get("summary"),
-                            article.get("content"),
-                            json.dumps(article.get("manual_labels")) if article.get("manual_labels") else None
-                        )
-                    )
-                    if cursor.lastrowid:
-                        article_ids.append(cursor.lastrowid)
+            # Write in fixed-size transactions so large backfills never hold every row in memory
+            while batch := list(islice(rows, self.SAVE_BATCH_SIZE)):
+                # Take the write lock up front so the batch never has to upgrade a read
+                # lock mid-transaction (and, on the fallback path, no other writer can
+                # insert between reading MAX(id) and our insert)
+                cursor.execute("BEGIN IMMEDIATE")
+                if not _SUPPORTS_RETURNING:
+                    cursor.execute(_SQL_MAX_ARTICLE_ID)
+                    last_id = cursor.fetchone()[0]
+                # Multi-row VALUES runs one statement per chunk instead of one per row;
+                # duplicates are ignored by the unique link index
+                for start in range(0, len(batch), rows_per_statement):
+                    chunk = batch[start:start + rows_per_statement]
+                    cursor.execute(_insert_articles_sql(len(chunk)), list(chain.from_iterable(chunk)))
+                    if _SUPPORTS_RETURNING:
+                        # RETURNING order is unspecified, so sort to keep insertion order
+                        article_ids.extend(sorted(row[0] for row in cursor.fetchall()))
+                if not _SUPPORTS_RETURNING:
+                    # Ignored rows don't consume ids, so everything above last_id was inserted here
+                    cursor.execute(_SQL_ARTICLE_IDS_AFTER, (last_id,))
+                    article_ids.extend(row[0] for row in cursor.fetchall())
                 conn.commit()
-                return article_ids
+            return article_ids
         except sqlite3.Error as e:
+            if conn.in_transaction:
+                conn.rollback()
             raise StorageError(f"Failed to save articles: {e}")
 
     def get_article(self, article_id: int) -> Optional[Dict[str, Any]]:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    SELECT id, feed_id, title, link, published_at, fetched_at, updated_at,
-                           status, summary, content, deleted_at, manual_labels
-                    FROM rss_articles WHERE id = ?
-                    """,
-                    (article_id,)
-                )
+                cursor.execute(_SQL_SELECT_ARTICLE, (article_id,))
                 row = cursor.fetchone()
                 if row:
-                    return {
-                        "id": row[0],
-                        "feed_id": row[1],
-                        "title": row[2],
-                        "link": row[3],
-                        "published_at": row[4],
-                        "fetched_at": row[5],
-                        "updated_at": row[6],
-                        "status": row[7],
-                        "summary": row[8],
-                        "content": row[9],
-                        "deleted_at": row[10],
-                        "manual_labels": json.loads(row[11]) if row[11] else None
-                    }
+                    return _article_from_row(row)
                 return None
         except sqlite3.Error as e:
             raise StorageError(f"Failed to get article: {e}")
@@ -546,97 +749,118 @@ class SQLiteStorage(BaseStorage):
         offset: Optional[int] = None,
         include_deleted: bool = False
     ) -> List[Dict[str, Any]]:
+        return list(self.iter_articles(
+            feed_id=feed_id,
+            category_id=category_id,
+            tag_ids=tag_ids,
+            status=status,
+            before_date=before_date,
+            after_date=after_date,
+            limit=limit,
+            offset=offset,
+            include_deleted=include_deleted
+        ))
+
+    def iter_articles(
+        self,
+        feed_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+        tag_ids: Optional[List[int]] = None,
+        status: Optional[str] = None,
+        before_date: Optional[datetime] = None,
+        after_date: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        include_deleted: bool = False
+    ) -> Iterator[Dict[str, Any]]:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                query = """
-                    SELECT DISTINCT a.id, a.feed_id, a.title, a.link, a.published_at,
-                           a.fetched_at, a.updated_at, a.status, a.summary, a.content,
-                           a.deleted_at, a.manual_labels
-                    FROM rss_articles a
-                    LEFT JOIN rss_feeds f ON a.feed_id = f.id
-                    LEFT JOIN articles_tags at ON a.id = at.article_id
-                    WHERE 1=1
-                """
                 params = []
                 
                 if feed_id is not None:
-                    query += " AND a.feed_id = ?"
                     params.append(feed_id)
                 
                 if category_id is not None:
-                    query += " AND f.category_id = ?"
                     params.append(category_id)
                 
                 if tag_ids:
-                    placeholders = ','.join('?' * len(tag_ids))
-                    query += f" AND at.tag_id IN ({placeholders})"
                     params.extend(tag_ids)
                 
                 if status is not None:
-                    query += " AND a.status = ?"
                     params.append(status)
                 
                 if before_date:
-                    query += " AND a.published_at < ?"
                     params.append(before_date.isoformat())
                 
                 if after_date:
-                    query += " AND a.published_at > ?"
                     params.append(after_date.isoformat())
                 
-                if not include_deleted:
-                    query += " AND a.deleted_at IS NULL"
-                
-                query += " ORDER BY a.published_at DESC"
-                
                 if limit is not None:
-                    query += " LIMIT ?"
                     params.append(limit)
                 
                 if offset is not None:
-                    query += " OFFSET ?"
                     params.append(offset)
                 
+                query = _articles_query(
+                    feed_id is not None,
+                    category_id is not None,
+                    len(tag_ids) if tag_ids else 0,
+                    status is not None,
+                    bool(before_date),
+                    bool(after_date),
+                    include_deleted,
+                    limit is not None,
+                    offset is not None
+                )
                 cursor.execute(query, params)
-                return [
-                    {
-                        "id": row[0],
-                        "feed_id": row[1],
-                        "title": row[2],
-                        "link": row[3],
-                        "published_at": row[4],
-                        "fetched_at": row[5],
-                        "updated_at": row[6],
-                        "status": row[7],
-                        "summary": row[8],
-                        "content": row[9],
-                        "deleted_at": row[10],
-                        "manual_labels": json.loads(row[11]) if row[11] else None
-                    }
-                    for row in cursor.fetchall()
-                ]
+                # Read in chunks so only FETCH_BATCH_SIZE rows are held at a time
+                while rows := cursor.fetchmany(self.FETCH_BATCH_SIZE):
+                    for row in rows:
+                        yield _article_from_row(row)
         except sqlite3.Error as e:
             raise StorageError(f"Failed to get articles: {e}")
 
-    def update_article(self, article_id: int, updates: Dict[str, Any]) -> bool:
+    def search_articles(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        include_deleted: bool = False
+    ) -> List[Dict[str, Any]]:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                set_clauses = []
-                params = []
+                # The FTS5 index answers MATCH without scanning the article text
+                sql = _SQL_SEARCH_ARTICLES
+                params: List[Any] = [query]
                 
-                for key, value in updates.items():
-                    if key in ['title', 'link', 'status', 'summary', 'content', 'manual_labels']:
-                        if key == 'manual_labels' and value is not None:
-                            value = json.dumps(value)
-                        set_clauses.append(f"{key} = ?")
-                        params.append(value)
+                if not include_deleted:
+                    sql += " AND a.deleted_at IS NULL"
                 
-                if not set_clauses:
+                sql += " ORDER BY rss_articles_fts.rank"
+                
+                if limit is not None:
+                    sql += " LIMIT ?"
+                    params.append(limit)
+                
+                cursor.execute(sql, params)
+                return [_article_from_row(row) for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to search articles: {e}")
+
+    def update_article(self, article_id: int, updates: Dict[str, Any]) -> bool:
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                pairs = [(key, value) for key, value in updates.items() if key in _ARTICLE_UPDATABLE]
+                if not pairs:
                     return False
                 
-                query = f"UPDATE rss_articles SET {', '.join(set_clauses)} WHERE id = ?"
+                query = f"UPDATE rss_articles SET {', '.join(f'{key} = ?' for key, _ in pairs)} WHERE id = ?"
+                params = [
+                    _dumps_json(value) if key == 'manual_labels' and value is not None else value
+                    for key, value in pairs
+                ]
                 params.append(article_id)
                 
                 cursor.execute(query, params)
@@ -650,12 +874,9 @@ class SQLiteStorage(BaseStorage):
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 if hard_delete:
-                    cursor.execute("DELETE FROM rss_articles WHERE id = ?", (article_id,))
+                    cursor.execute(_SQL_DELETE_ARTICLE, (article_id,))
                 else:
-                    cursor.execute(
-                        "UPDATE rss_articles SET deleted_at = ? WHERE id = ?",
-                        (datetime.now().isoformat(), article_id)
-                    )
+                    cursor.execute(_SQL_SOFT_DELETE_ARTICLE, (_utcnow_timestamp(), article_id))
                 conn.commit()
                 return cursor.rowcount > 0
         except sqlite3.Error as e:
@@ -670,20 +891,40 @@ class SQLiteStorage(BaseStorage):
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                query = "DELETE FROM rss_articles WHERE 1=1"
+                where = "1=1"
                 params = []
                 
                 if feed_id is not None:
-                    query += " AND feed_id = ?"
+                    where += " AND feed_id = ?"
                     params.append(feed_id)
                 
                 if before_date:
-                    query += " AND published_at < ?"
+                    where += " AND published_at < ?"
                     params.append(before_date.isoformat())
                 
-                cursor.execute(query, params)
-                conn.commit()
-                return cursor.rowcount
+                # Work in bounded batches, committing in between, so a large purge
+                # never holds the write lock (or grows the WAL) for the whole run
+                if hard_delete:
+                    query = (
+                        "DELETE FROM rss_articles WHERE id IN "
+                        f"(SELECT id FROM rss_articles WHERE {where} LIMIT ?)"
+                    )
+                else:
+                    # Soft delete stamps every row with one timestamp; skipping rows
+                    # already deleted keeps their original time and ends the loop
+                    query = (
+                        "UPDATE rss_articles SET deleted_at = ? WHERE id IN "
+                        f"(SELECT id FROM rss_articles WHERE {where} AND deleted_at IS NULL LIMIT ?)"
+                    )
+                    params.insert(0, _utcnow_timestamp())
+                params.append(self.DELETE_BATCH_SIZE)
+                total = 0
+                while True:
+                    cursor.execute(query, params)
+                    conn.commit()
+                    if cursor.rowcount <= 0:
+                        return total
+                    total += cursor.rowcount
         except sqlite3.Error as e:
             raise StorageError(f"Failed to delete articles: {e}")
 
@@ -691,10 +932,7 @@ class SQLiteStorage(BaseStorage):
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    "INSERT OR IGNORE INTO articles_tags (article_id, tag_id) VALUES (?, ?)",
-                    (article_id, tag_id)
-                )
+                cursor.execute(_SQL_ADD_TAG_TO_ARTICLE, (article_id, tag_id))
                 conn.commit()
                 return cursor.rowcount > 0
         except sqlite3.Error as e:
@@ -704,21 +942,23 @@ class SQLiteStorage(BaseStorage):
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    "DELETE FROM articles_tags WHERE article_id = ? AND tag_id = ?",
-                    (article_id, tag_id)
-                )
+                cursor.execute(_SQL_REMOVE_TAG_FROM_ARTICLE, (article_id, tag_id))
                 conn.commit()
                 return cursor.rowcount > 0
         except sqlite3.Error as e:
             raise StorageError(f"Failed to remove tag from article: {e}")
 
     def close(self) -> None:
-        """Close the database connection."""
-        if self._conn is not None:
-            try:
-                self._conn.close()
-                self._conn = None
-            except sqlite3.Error as e:
-                logger.error(f"Error closing database connection: {e}")
-                raise StorageError(f"Failed to close database connection: {e}")
+        """Close the database connections of all threads."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        # Threads that still hold a closed connection open a new one on next use
+        self._local = threading.local()
+        try:
+            for conn in connections:
+                # Let SQLite refresh planner statistics for tables that changed
+                conn.execute("PRAGMA optimize")
+                conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error closing database connection: {e}")
+            raise StorageError(f"Failed to close database connection: {e}")
@@ -6,6 +6,7 @@ in various formats commonly found in RSS feeds and other data sources.
 """
 
 import datetime
+import functools
 from email.utils import parsedate_to_datetime
 from typing import Optional
 
@@ -16,14 +17,28 @@ except ImportError:
     DATEUTIL_AVAILABLE = False
 
 
+# Fallback formats for strings neither RFC 2822 nor ISO 8601 parsers accept
+_FALLBACK_FORMATS = (
+    "%Y-%m-%dT%H:%M:%SZ",       # ISO 8601 format without timezone
+    "%Y-%m-%dT%H:%M:%S.%fZ",    # ISO 8601 with milliseconds
+    "%Y-%m-%d %H:%M:%S",        # Basic format
+    "%Y-%m-%d",                 # Just date
+)
+
+
+@functools.lru_cache(maxsize=8192)
 def parse_date_flexible(date_str: str) -> datetime.datetime:
     """
     Parse a date string in various formats into a datetime object.
     
     This function tries different methods to parse the date:
-    1. First attempts RFC 2822 format using email.utils.parsedate_to_datetime
-    2. Falls back to dateutil.parser for ISO 8601 and other formats if available
-    3. As a last resort, attempts basic ISO format parsing with strptime
+    1. Strings starting with "YYYY-" go to datetime.fromisoformat (ISO 8601);
+       anything else to email.utils.parsedate_to_datetime (RFC 2822)
+    2. Falls back to dateutil.parser for other formats if available
+    3. As a last resort, attempts a few common formats with strptime
+
+    Results are memoized by the raw string, since feeds repeat the same
+    date values across polls; call parse_date_flexible.cache_clear() to reset.
     
     Args:
         date_str: Date string to parse
@@ -34,33 +49,37 @@ def parse_date_flexible(date_str: str) -> datetime.datetime:
     Raises:
         ValueError: If the date string cannot be parsed
     """
-    try:
-        # First try RFC 2822 format (email header format)
-        return parsedate_to_datetime(date_str)
-    except Exception:
-        # Then try ISO 8601 and other formats using dateutil if available
-        if DATEUTIL_AVAILABLE:
-            try:
-                return date_parser.parse(date_str)
-            except Exception:
-                pass
-        
-        # Try some common formats as a last resort
-        formats_to_try = [
-            "%Y-%m-%dT%H:%M:%SZ",       # ISO 8601 format without timezone
-            "%Y-%m-%dT%H:%M:%S.%fZ",    # ISO 8601 with milliseconds
-            "%Y-%m-%d %H:%M:%S",        # Basic format
-            "%Y-%m-%d",                 # Just date
-        ]
-        
-        for fmt in formats_to_try:
-            try:
-                return datetime.datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
-                
-        # If we get here, all parsing attempts failed
-        raise ValueError(f"Invalid date value or format: {date_str}")
+    # Sniff the shape so each string gets one parser attempt instead of failing
+    # through the other one first
+    if date_str[:4].isdigit() and date_str[4:5] == "-":
+        # ISO 8601 (Atom feeds); fromisoformat accepts a trailing Z since 3.11
+        try:
+            return datetime.datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+    else:
+        # RFC 2822 format (RSS pubDate, email header format)
+        try:
+            return parsedate_to_datetime(date_str)
+        except Exception:
+            pass
+
+    # Then try other formats using dateutil if available
+    if DATEUTIL_AVAILABLE:
+        try:
+            return date_parser.parse(date_str)
+        except Exception:
+            pass
+    
+    # Try some common formats as a last resort
+    for fmt in _FALLBACK_FORMATS:
+        try:
+            return datetime.datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+            
+    # If we get here, all parsing attempts failed
+    raise ValueError(f"Invalid date value or format: {date_str}")
 
 
 def format_datetime_for_display(dt: datetime.datetime, include_time: bool = True) -> str:
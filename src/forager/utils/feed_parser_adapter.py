@@ -1,87 +1,272 @@
 """
 Feed parser utilities with anti-scraping capabilities.
 """
+import hashlib
 import io
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import feedparser
-from typing import Dict, Any, Optional, List
+import requests
+from typing import Dict, Any, MutableMapping, Optional, List, Tuple
 from forager.utils.http import HttpClient
 
+logger = logging.getLogger(__name__)
+
 class FeedParserAdapter:
     """
     Adapter for feedparser that uses the HttpClient for requests.
     Enables anti-scraping capabilities for RSS feed fetching.
     """
     
-    def __init__(self, http_client: Optional[HttpClient] = None):
+    # Seconds to wait for the server before giving up on a feed
+    DEFAULT_TIMEOUT = 10
+
+    # Most shared adapters create_with_defaults keeps; older User-Agents are evicted
+    MAX_DEFAULT_INSTANCES = 4
+
+    # Shared adapters handed out by create_with_defaults, keyed by class and User-Agent,
+    # least recently used first
+    _default_instances: 'OrderedDict[Any, FeedParserAdapter]' = OrderedDict()
+    _default_instances_lock = threading.Lock()
+
+    # HttpClient used by adapters created without one, built on first use
+    _default_client: Optional[HttpClient] = None
+    _default_client_lock = threading.Lock()
+
+    def __init__(self, http_client: Optional[HttpClient] = None, timeout: float = DEFAULT_TIMEOUT,
+                 cache: Optional[MutableMapping[str, Tuple[Optional[str], Optional[str], feedparser.FeedParserDict]]] = None):
         """
         Initialize the adapter.
         
         Args:
-            http_client: The HTTP client to use for requests.
-                         If None, a default one will be created.
+            http_client: The HTTP client to use for requests. Its pooled session is
+                         shared by every feed fetched through this adapter.
+                         If None, a default client shared by all such adapters is
+                         used, so changes to its strategies affect all of them.
+            timeout: Request timeout in seconds.
+            cache: Optional mapping of URL to (etag, last_modified, parsed feed).
+                   When given, parse() sends the stored validators for callers that
+                   pass none of their own and returns the stored feed on HTTP 304.
+                   Any MutableMapping works, e.g. a dict or a persistent store.
         """
-        self.http_client = http_client or HttpClient.create_with_defaults()
+        self.http_client = http_client or self._get_default_client()
+        self.timeout = timeout
+        self.cache = cache
     
-    def parse(self, url: str, debug: bool = False, **kwargs) -> feedparser.FeedParserDict:
+    @classmethod
+    def _get_default_client(cls) -> HttpClient:
+        """Return the HttpClient shared by adapters created without one."""
+        with cls._default_client_lock:
+            if cls._default_client is None:
+                cls._default_client = HttpClient.create_with_defaults()
+            return cls._default_client
+
+    def download(self, url: str, debug: bool = False, etag: Optional[str] = None,
+                 modified: Optional[str] = None, throttle: bool = True) -> requests.Response:
+        """
+        Download a feed body using the HTTP client, without parsing it.
+
+        Args:
+            url: The URL to fetch the feed from.
+            debug: Passed on to the HTTP client; debug output goes to this module's logger.
+            etag: ETag from the previous fetch, sent as If-None-Match.
+            modified: Last-Modified from the previous fetch, sent as If-Modified-Since.
+            throttle: Whether the HTTP client applies its throttling strategies.
+
+        Returns:
+            The HTTP response holding the raw feed body (status 304 if unchanged).
+        """
+        # Conditional GET headers let the server answer 304 for an unchanged feed
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if modified:
+            headers["If-Modified-Since"] = modified
+
+        # Get content via HTTP client with anti-scraping capabilities
+        response = self.http_client.get(url, headers=headers, debug=debug, throttle=throttle,
+                                        timeout=self.timeout)
+
+        # feedparser gets the raw bytes and works out the charset itself from the XML
+        # declaration and Content-Type, so no charset detection is run on the body here
+        logger.debug("Feed encoding: %s", response.encoding)
+
+        return response
+
+    @staticmethod
+    def hash_content(content: bytes) -> str:
+        """
+        Compute the digest used to detect an unchanged feed body.
+
+        Args:
+            content: The raw feed body.
+
+        Returns:
+            Hex digest of the body.
+        """
+        return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+    def parse_response(self, response: requests.Response, debug: bool = False,
+                       content_hash: Optional[str] = None, **kwargs) -> feedparser.FeedParserDict:
+        """
+        Parse a feed from an already downloaded HTTP response.
+
+        Args:
+            response: The response returned by download().
+            debug: Unused; debug output goes to this module's logger.
+            content_hash: Body digest from the previous fetch. If the new body
+                          hashes to the same value, parsing is skipped.
+            **kwargs: Additional arguments to pass to feedparser.
+
+        Returns:
+            The parsed feed.
+        """
+        if response.status_code == 304:
+            logger.debug("Feed not modified since last fetch (HTTP 304)")
+            return feedparser.FeedParserDict(
+                entries=[],
+                bozo=False,
+                status=304,
+                headers=response.headers,
+                etag=response.headers.get('ETag'),
+                modified=response.headers.get('Last-Modified'),
+            )
+
+        # Many servers send no validators; an identical body means nothing new to parse
+        body_hash = self.hash_content(response.content)
+        if content_hash and body_hash == content_hash:
+            logger.debug("Feed body unchanged since last fetch, skipping parse")
+            return feedparser.FeedParserDict(
+                entries=[],
+                bozo=False,
+                status=response.status_code,
+                not_modified=True,
+                content_hash=body_hash,
+                headers=response.headers,
+                etag=response.headers.get('ETag'),
+                modified=response.headers.get('Last-Modified'),
+            )
+
+        logger.debug("Passing content to feedparser")
+
+        # Pass the content to feedparser
+        feed = feedparser.parse(
+            io.BytesIO(response.content),
+            response_headers={
+                'content-type': response.headers.get('content-type', '')
+            },
+            **kwargs
+        )
+
+        # Expose the HTTP status and cache validators like feedparser does for URLs it fetches
+        feed['status'] = response.status_code
+        feed['etag'] = response.headers.get('ETag')
+        feed['modified'] = response.headers.get('Last-Modified')
+        feed['content_hash'] = body_hash
+
+        logger.debug("Feed parsed successfully, found %s entries", len(feed.entries))
+        logger.debug("Feed bozo flag: %s", feed.bozo)
+        if feed.bozo and hasattr(feed, 'bozo_exception'):
+            logger.debug("Feed exception: %s", feed.bozo_exception)
+
+        return feed
+
+    def parse(self, url: str, debug: bool = False, etag: Optional[str] = None,
+              modified: Optional[str] = None, content_hash: Optional[str] = None,
+              **kwargs) -> feedparser.FeedParserDict:
         """
         Parse a feed from a URL using the HTTP client.
+
+        This is download() followed by parse_response(); callers that want to
+        overlap network I/O across feeds can run the two steps separately.
         
         Args:
             url: The URL to fetch the feed from.
-            debug: Whether to print debug information during parsing.
+            debug: Passed on to download(); debug output goes to this module's logger.
+            etag: ETag from the previous fetch, for a conditional GET.
+            modified: Last-Modified from the previous fetch, for a conditional GET.
+            content_hash: Body digest from the previous fetch.
             **kwargs: Additional arguments to pass to feedparser.
             
         Returns:
-            The parsed feed.
+            The parsed feed. feed.entries is empty when the server reports the
+            feed as unchanged (feed.status 304) or the body hashes to
+            content_hash (feed.not_modified), unless the feed was served from
+            the adapter's cache.
         """
-        if debug:
-            print(f"[DEBUG] Parsing feed: {url}")
+        logger.debug("Parsing feed: %s", url)
         
         try:
-            # Get content via HTTP client with anti-scraping capabilities
-            response = self.http_client.get(url, debug=debug)
-            
-            if debug:
-                print(f"[DEBUG] Feed encoding: {response.encoding}")
-                print(f"[DEBUG] Feed apparent encoding: {response.apparent_encoding}")
-            
-            # Ensure proper encoding for feedparser
-            if response.encoding:
-                response.encoding = response.apparent_encoding or 'utf-8'
-                if debug:
-                    print(f"[DEBUG] Using encoding: {response.encoding}")
-            
-            if debug:
-                print("[DEBUG] Passing content to feedparser")
-                
-            # Pass the content to feedparser
-            feed = feedparser.parse(
-                io.BytesIO(response.content),
-                response_headers={
-                    'content-type': response.headers.get('content-type', '')
-                },
-                **kwargs
-            )
-            
-            if debug:
-                print(f"[DEBUG] Feed parsed successfully, found {len(feed.entries)} entries")
-                print(f"[DEBUG] Feed bozo flag: {feed.bozo}")
-                if feed.bozo and hasattr(feed, 'bozo_exception'):
-                    print(f"[DEBUG] Feed exception: {feed.bozo_exception}")
-                    
+            # Fall back to the cached validators when the caller tracks none itself
+            cached = None
+            if self.cache is not None and etag is None and modified is None:
+                cached = self.cache.get(url)
+                if cached is not None:
+                    etag, modified, _ = cached
+
+            response = self.download(url, debug=debug, etag=etag, modified=modified)
+            if cached is not None and response.status_code == 304:
+                logger.debug("Feed not modified, returning cached feed")
+                return cached[2]
+
+            feed = self.parse_response(response, debug=debug, content_hash=content_hash, **kwargs)
+            if (self.cache is not None and response.status_code != 304
+                    and not feed.get('not_modified') and (feed['etag'] or feed['modified'])):
+                self.cache[url] = (feed['etag'], feed['modified'], feed)
             return feed
-            
         except Exception as e:
-            if debug:
-                print(f"[DEBUG] Error parsing feed: {str(e)}")
-                import traceback
-                print(f"[DEBUG] Traceback: {traceback.format_exc()}")
+            logger.debug("Error parsing feed: %s", e, exc_info=True)
             raise
     
+    def parse_many(self, urls: List[str], max_workers: int = 8, debug: bool = False,
+                   throttle: bool = True, **kwargs) -> List[Any]:
+        """
+        Fetch several feeds concurrently and parse them.
+
+        Downloads run in a thread pool, so total latency is close to that of the
+        slowest feed. The client's throttling only spaces out requests to the same
+        host, so feeds on different hosts are never held back. Each body is parsed on
+        the calling thread as soon as it arrives, so parsing overlaps the
+        remaining downloads.
+
+        Args:
+            urls: The URLs to fetch.
+            max_workers: Maximum number of concurrent downloads.
+            debug: Passed on to download(); debug output goes to this module's logger.
+            throttle: Whether the HTTP client applies its throttling strategies.
+            **kwargs: Additional arguments to pass to feedparser.
+
+        Returns:
+            Per-URL parsed feeds, or the exception raised for that URL, in the
+            same order as urls.
+        """
+        results: List[Any] = [None] * len(urls)
+        if not urls:
+            return results
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls)))) as executor:
+            futures = {
+                executor.submit(self.download, url, debug=debug, throttle=throttle): i
+                for i, url in enumerate(urls)
+            }
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = self.parse_response(future.result(), debug=debug, **kwargs)
+                except Exception as e:
+                    results[futures[future]] = e
+        return results
+
     @classmethod
     def create_with_defaults(cls, user_agent: Optional[str] = None) -> 'FeedParserAdapter':
         """
-        Create a FeedParserAdapter with default anti-scraping strategies.
+        Get a FeedParserAdapter with default anti-scraping strategies.
+
+        The adapter is created once per User-Agent and shared afterwards, so its
+        pooled keep-alive connections survive across polling cycles. It holds no
+        per-request state and is safe to use from several threads. Only the
+        MAX_DEFAULT_INSTANCES most recently requested User-Agents are kept; an
+        evicted adapter keeps working for its holders but is no longer shared.
         
         Args:
             user_agent: Optional fixed User-Agent to use.
@@ -89,5 +274,18 @@ class FeedParserAdapter:
         Returns:
             Configured FeedParserAdapter instance.
         """
-        http_client = HttpClient.create_with_defaults(user_agent=user_agent)
-        return cls(http_client=http_client) 
\ No newline at end of file
+        key = (cls, user_agent)
+        with cls._default_instances_lock:
+            adapter = cls._default_instances.get(key)
+            if adapter is None:
+                if user_agent is None:
+                    http_client = cls._get_default_client()
+                else:
+                    http_client = HttpClient.create_with_defaults(user_agent=user_agent)
+                adapter = cls(http_client=http_client)
+                cls._default_instances[key] = adapter
+                while len(cls._default_instances) > cls.MAX_DEFAULT_INSTANCES:
+                    cls._default_instances.popitem(last=False)
+            else:
+                cls._default_instances.move_to_end(key)
+            return adapter 
\ No newline at end of file
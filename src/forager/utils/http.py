@@ -1,13 +1,20 @@
 """
 HTTP utilities module with anti-scraping capabilities.
 """
+import logging
 import random
+import threading
 import time
-from typing import Dict, Optional, List, Union, Callable, Any
+from types import MappingProxyType
+from typing import Dict, Optional, List, Sequence, Tuple, Union, Callable, Any
+from urllib.parse import urlsplit
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 from urllib3.util.retry import Retry
 
+logger = logging.getLogger(__name__)
+
 class AntiScrapingStrategy:
     """Base class for anti-scraping strategies."""
     
@@ -32,37 +39,45 @@ class UserAgentRotationStrategy(AntiScrapingStrategy):
     """Strategy for rotating User-Agent headers."""
     
     # Common browser User-Agents
-    DEFAULT_USER_AGENTS = [
+    DEFAULT_USER_AGENTS = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Safari/605.1.15",
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0",
         "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.107 Safari/537.36",
         "Mozilla/5.0 (iPhone; CPU iPhone OS 14_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1"
-    ]
+    )
     
-    def __init__(self, user_agents: Optional[List[str]] = None, fixed_user_agent: Optional[str] = None):
+    def __init__(self, user_agents: Optional[Sequence[str]] = None, fixed_user_agent: Optional[str] = None):
         """
         Initialize the User-Agent rotation strategy.
         
         Args:
-            user_agents: List of User-Agent strings to rotate through.
+            user_agents: User-Agent strings to rotate through.
             fixed_user_agent: A specific User-Agent to use instead of rotating.
         """
-        self.user_agents = user_agents or self.DEFAULT_USER_AGENTS
+        self.user_agents = tuple(user_agents or self.DEFAULT_USER_AGENTS)
         self.fixed_user_agent = fixed_user_agent
+
+    def choose_user_agent(self) -> str:
+        """Return the User-Agent for the next request."""
+        if self.fixed_user_agent:
+            return self.fixed_user_agent
+        return random.choice(self.user_agents)
         
     def apply_to_headers(self, headers: Dict[str, str]) -> Dict[str, str]:
         """Apply a User-Agent to the headers."""
         headers = headers.copy()
-        if self.fixed_user_agent:
-            headers["User-Agent"] = self.fixed_user_agent
-        else:
-            headers["User-Agent"] = random.choice(self.user_agents)
+        headers["User-Agent"] = self.choose_user_agent()
         return headers
 
 
 class RequestThrottlingStrategy(AntiScrapingStrategy):
-    """Strategy for throttling requests to avoid rate limiting."""
+    """
+    Strategy for throttling requests to avoid rate limiting.
+
+    HttpClient spaces out requests per host with wait_for(), so concurrent
+    fetches from different hosts never wait for each other.
+    """
     
     def __init__(self, min_delay: float = 1.0, max_delay: float = 3.0, jitter: bool = True):
         """
@@ -76,14 +91,57 @@ class RequestThrottlingStrategy(AntiScrapingStrategy):
         self.min_delay = min_delay
         self.max_delay = max_delay
         self.jitter = jitter
+        # Earliest monotonic time the next request to each host may start
+        self._next_request_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _delay(self) -> float:
+        """Return the delay to keep between two requests."""
+        if self.jitter:
+            return random.uniform(self.min_delay, self.max_delay)
+        return self.min_delay
         
     def pre_request(self) -> None:
         """Wait before making a request."""
-        if self.jitter:
-            delay = random.uniform(self.min_delay, self.max_delay)
-        else:
-            delay = self.min_delay
-        time.sleep(delay)
+        time.sleep(self._delay())
+
+    def wait_for(self, url: str) -> float:
+        """
+        Wait until a request to the URL's host may be made.
+
+        Each call reserves the next free slot for its host, so requests to the
+        same host are at least one delay apart even when made from several threads.
+
+        Args:
+            url: The URL about to be requested.
+
+        Returns:
+            The time the reserved slot ends, to pass to release().
+        """
+        host = urlsplit(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_request_at.get(host, now))
+            reserved_until = self._next_request_at[host] = start + self._delay()
+        if start > now:
+            time.sleep(start - now)
+        return reserved_until
+
+    def release(self, url: str, reserved_until: float) -> None:
+        """
+        Give back the delay reserved by wait_for(), e.g. after a 304 response.
+
+        Nothing changes if another request to the host has reserved a later slot
+        in the meantime.
+
+        Args:
+            url: The requested URL.
+            reserved_until: The value returned by wait_for().
+        """
+        host = urlsplit(url).netloc
+        with self._lock:
+            if self._next_request_at.get(host) == reserved_until:
+                self._next_request_at[host] = time.monotonic()
 
 
 class RetryStrategy(AntiScrapingStrategy):
@@ -93,7 +151,8 @@ class RetryStrategy(AntiScrapingStrategy):
         self, 
         retries: int = 3, 
         backoff_factor: float = 0.3,
-        status_forcelist: Optional[List[int]] = None
+        status_forcelist: Optional[List[int]] = None,
+        pool_size: int = 16
     ):
         """
         Initialize the retry strategy.
@@ -102,66 +161,158 @@ class RetryStrategy(AntiScrapingStrategy):
             retries: Number of retries.
             backoff_factor: Backoff factor for retry delay.
             status_forcelist: List of HTTP status codes to force retry.
+            pool_size: Number of keep-alive connections pooled per host by the mounted adapter.
         """
         self.retries = retries
         self.backoff_factor = backoff_factor
         self.status_forcelist = status_forcelist or [429, 500, 502, 503, 504]
+        self.pool_size = pool_size
+        # Built once and shared by every session; urllib3 copies a Retry on each attempt
+        # rather than mutating it. Only idempotent methods are retried.
+        self._retry = Retry(
+            total=retries,
+            read=retries,
+            connect=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=self.status_forcelist,
+            allowed_methods=frozenset({"HEAD", "GET", "OPTIONS"}),
+            respect_retry_after_header=True,
+        )
     
     def apply_to_session(self, session: requests.Session) -> None:
         """Apply retry adapter to session."""
-        retry = Retry(
-            total=self.retries,
-            read=self.retries,
-            connect=self.retries,
-            backoff_factor=self.backoff_factor,
-            status_forcelist=self.status_forcelist,
+        # Size the pool so concurrent feed fetches reuse connections instead of discarding them
+        adapter = HTTPAdapter(
+            max_retries=self._retry,
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
         )
-        adapter = HTTPAdapter(max_retries=retry)
         session.mount('http://', adapter)
         session.mount('https://', adapter)
 
 
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of making a request to a host that keeps failing."""
+
+
+class CircuitBreakerStrategy(AntiScrapingStrategy):
+    """
+    Strategy for skipping hosts that keep failing.
+
+    After fail_threshold consecutive failed requests to a host (connection errors,
+    exhausted retries or 5xx responses), further requests to it raise
+    CircuitOpenError without touching the network for open_seconds. The next
+    request after that is let through; a success closes the circuit again.
+    """
+
+    def __init__(self, fail_threshold: int = 5, open_seconds: float = 600.0):
+        """
+        Initialize the circuit breaker strategy.
+
+        Args:
+            fail_threshold: Consecutive failures after which a host is skipped.
+            open_seconds: Seconds a failing host is skipped for.
+        """
+        self.fail_threshold = fail_threshold
+        self.open_seconds = open_seconds
+        # Consecutive failures and monotonic time of the last failure, per host
+        self._failures: Dict[str, Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    def check(self, url: str) -> None:
+        """
+        Raise CircuitOpenError if requests to the URL's host are being skipped.
+
+        Args:
+            url: The URL about to be requested.
+        """
+        host = urlsplit(url).netloc
+        with self._lock:
+            count, failed_at = self._failures.get(host, (0, 0.0))
+        if count >= self.fail_threshold and time.monotonic() - failed_at < self.open_seconds:
+            raise CircuitOpenError(f"Skipping {host}: {count} consecutive failed requests")
+
+    def record(self, url: str, failed: bool) -> None:
+        """
+        Record the outcome of a request.
+
+        Args:
+            url: The requested URL.
+            failed: Whether the request failed.
+        """
+        host = urlsplit(url).netloc
+        with self._lock:
+            if failed:
+                count, _ = self._failures.get(host, (0, 0.0))
+                self._failures[host] = (count + 1, time.monotonic())
+            else:
+                self._failures.pop(host, None)
+
+
 class StandardHeadersStrategy(AntiScrapingStrategy):
     """Strategy for adding standard headers that most browsers use."""
+
+    # Read-only so the shared defaults can't be changed by accident
+    DEFAULT_HEADERS = MappingProxyType({
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.5",
+        # only the encodings urllib3 can decode here (br needs brotli installed),
+        # otherwise a compressed body would reach feedparser undecoded
+        "Accept-Encoding": ACCEPT_ENCODING,
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1",
+        "Cache-Control": "max-age=0"
+    })
     
     def apply_to_headers(self, headers: Dict[str, str]) -> Dict[str, str]:
-        """Apply standard headers."""
-        default_headers = {
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "Cache-Control": "max-age=0"
-        }
-        
-        # Copy headers to avoid modifying the original
-        headers = headers.copy()
-        
-        # Only add default headers if they don't already exist
-        for key, value in default_headers.items():
-            if key not in headers:
-                headers[key] = value
-                
-        return headers
+        """Apply standard headers, keeping any that are already set."""
+        return {**self.DEFAULT_HEADERS, **headers}
 
 
 class HttpClient:
     """HTTP client with anti-scraping capabilities."""
+
+    # Keep-alive connections pooled per host
+    DEFAULT_POOL_SIZE = 16
     
-    def __init__(self, strategies: Optional[List[AntiScrapingStrategy]] = None):
+    def __init__(self, strategies: Optional[List[AntiScrapingStrategy]] = None,
+                 pool_size: int = DEFAULT_POOL_SIZE):
         """
         Initialize the HTTP client.
         
         Args:
-            strategies: List of anti-scraping strategies to use.
+            strategies: List of anti-scraping strategies to use. They are grouped
+                        by hook here, so later changes to the list are not seen.
+            pool_size: Keep-alive connections pooled per host when no strategy
+                       mounts its own adapter.
         """
         self.strategies = strategies or []
+        self.pool_size = pool_size
         self.session = self._create_session()
+        self._user_agent_strategy: Optional[UserAgentRotationStrategy] = None
+        self._header_template = self._build_header_template()
+
+        # Strategies grouped by the hooks they implement, so a request only visits
+        # the ones that do something. Like the header template, these reflect the
+        # strategies passed in here.
+        self._header_strategies = [
+            s for s in self.strategies
+            if type(s).apply_to_headers is not AntiScrapingStrategy.apply_to_headers
+        ]
+        self._circuit_breakers = [s for s in self.strategies if isinstance(s, CircuitBreakerStrategy)]
+        self._throttles = [s for s in self.strategies if isinstance(s, RequestThrottlingStrategy)]
+        self._pre_strategies = [s for s in self.strategies if self._overrides_hook(s, "pre_request")]
+        self._post_strategies = [s for s in self.strategies if self._overrides_hook(s, "post_request")]
         
     def _create_session(self) -> requests.Session:
         """Create and configure a requests session."""
         session = requests.Session()
+
+        # requests pools only 10 connections per host by default, fewer than the
+        # concurrent fetches; RetryStrategy replaces this with its own pooled adapter
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
         
         # Apply session-level strategies
         for strategy in self.strategies:
@@ -169,68 +320,141 @@ class HttpClient:
             
         return session
     
+    @staticmethod
+    def _overrides_hook(strategy: AntiScrapingStrategy, name: str) -> bool:
+        """
+        Return whether the strategy's class overrides the named hook.
+
+        Circuit breakers and throttles are driven per URL rather than through
+        pre_request/post_request, so their hooks only count when a subclass
+        overrides them beyond the built-in class.
+        """
+        if isinstance(strategy, CircuitBreakerStrategy):
+            base = CircuitBreakerStrategy
+        elif isinstance(strategy, RequestThrottlingStrategy):
+            base = RequestThrottlingStrategy
+        else:
+            base = AntiScrapingStrategy
+        return getattr(type(strategy), name) is not getattr(base, name)
+
+    def _build_header_template(self) -> Optional[Dict[str, str]]:
+        """
+        Apply the header strategies once, for use as a template by every request.
+
+        Only the built-in strategies are known to add the same headers each time
+        (apart from the rotated User-Agent, which is chosen per request). If any
+        other strategy changes headers, None is returned and every request
+        applies the strategies in turn.
+        """
+        template: Dict[str, str] = {}
+        for strategy in self.strategies:
+            apply = type(strategy).apply_to_headers
+            if apply is UserAgentRotationStrategy.apply_to_headers:
+                self._user_agent_strategy = strategy
+            elif apply is StandardHeadersStrategy.apply_to_headers:
+                template = strategy.apply_to_headers(template)
+            elif apply is not AntiScrapingStrategy.apply_to_headers:
+                self._user_agent_strategy = None
+                return None
+        return template
+
     def _prepare_headers(self, headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
         """Prepare request headers by applying all strategies."""
+        if self._header_template is not None:
+            # Caller headers win over the standard ones; the User-Agent is always set
+            prepared_headers = self._header_template.copy()
+            if headers:
+                prepared_headers.update(headers)
+            if self._user_agent_strategy is not None:
+                prepared_headers["User-Agent"] = self._user_agent_strategy.choose_user_agent()
+            return prepared_headers
+
         # Start with provided headers or empty dict
         prepared_headers = headers.copy() if headers else {}
         
         # Apply header strategies
-        for strategy in self.strategies:
+        for strategy in self._header_strategies:
             prepared_headers = strategy.apply_to_headers(prepared_headers)
             
         return prepared_headers
     
-    def _execute_strategies(self, method: str) -> None:
-        """Execute strategy methods before or after requests."""
-        for strategy in self.strategies:
-            if method == "pre":
+    def _execute_strategies(self, method: str, url: str,
+                            throttle: bool = True) -> List[Tuple[RequestThrottlingStrategy, float]]:
+        """
+        Execute strategy methods before or after requests.
+
+        Returns:
+            The throttle slots reserved by a "pre" call, as (strategy, reserved_until).
+        """
+        reservations = []
+        if method == "pre":
+            # a host that is being skipped should not wait on the throttle first
+            for strategy in self._circuit_breakers:
+                strategy.check(url)
+            # throttled per host rather than by a sleep before every request
+            if throttle:
+                reservations = [(strategy, strategy.wait_for(url)) for strategy in self._throttles]
+            for strategy in self._pre_strategies:
                 strategy.pre_request()
-            elif method == "post":
+        elif method == "post":
+            for strategy in self._post_strategies:
                 strategy.post_request()
+        return reservations
+
+    def _record_result(self, url: str, failed: bool) -> None:
+        """Report the outcome of a request to the circuit breaker strategies."""
+        for strategy in self._circuit_breakers:
+            strategy.record(url, failed)
     
-    def get(self, url: str, headers: Optional[Dict[str, str]] = None, debug: bool = False, **kwargs) -> requests.Response:
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, debug: bool = False,
+            throttle: bool = True, **kwargs) -> requests.Response:
         """
         Make a GET request with anti-scraping measures.
         
         Args:
             url: URL to request.
             headers: Additional headers to send.
-            debug: Whether to print debug information during the request.
+            debug: Unused; debug output goes to this module's logger. Kept for
+                   compatibility with existing callers.
+            throttle: Whether to apply throttling strategies, which space out
+                      requests to the same host. Pass False for requests that
+                      should never wait, e.g. cache revalidation.
             **kwargs: Additional arguments to pass to requests.get.
             
         Returns:
-            Response object.
+            Response object. Its body has been read and the connection returned
+            to the pool, unless stream=True was passed; streaming callers must
+            close the response (or use it as a context manager). A 304 Not
+            Modified response is returned without running post-request strategies.
         """
-        if debug:
-            print(f"[DEBUG] HTTP GET: {url}")
-            
+        logger.debug("HTTP GET: %s", url)
         prepared_headers = self._prepare_headers(headers)
-        
-        if debug:
-            print(f"[DEBUG] Request headers: {prepared_headers}")
+        logger.debug("Request headers: %s", prepared_headers)
         
         # Pre-request strategies
-        if debug:
-            print("[DEBUG] Executing pre-request strategies")
-        self._execute_strategies("pre")
+        reservations = self._execute_strategies("pre", url, throttle)
         
         try:
-            if debug:
-                print("[DEBUG] Sending request...")
             response = self.session.get(url, headers=prepared_headers, **kwargs)
-            if debug:
-                print(f"[DEBUG] Response status: {response.status_code}")
-                print(f"[DEBUG] Response headers: {dict(response.headers)}")
-                print(f"[DEBUG] Response size: {len(response.content)} bytes")
-        except Exception as e:
-            if debug:
-                print(f"[DEBUG] Request failed: {str(e)}")
+            logger.debug("Response status: %s", response.status_code)
+            logger.debug("Response headers: %s", response.headers)
+            logger.debug("Response size: %s bytes", response.headers.get("Content-Length", "?"))
+        except requests.RequestException as e:
+            logger.debug("Request failed: %s", e)
+            self._record_result(url, failed=True)
             raise
+        self._record_result(url, failed=response.status_code >= 500)
+
+        # A 304 answers a conditional GET without a body, so the next request to
+        # the host need not wait out the delay reserved for this one, and the
+        # post-request strategies (e.g. a legacy post-request sleep) are skipped
+        if response.status_code == 304:
+            for strategy, reserved_until in reservations:
+                strategy.release(url, reserved_until)
+            return response
         
         # Post-request strategies
-        if debug:
-            print("[DEBUG] Executing post-request strategies")
-        self._execute_strategies("post")
+        self._execute_strategies("post", url, throttle)
         
         return response
 
@@ -244,27 +468,36 @@ class HttpClient:
             **kwargs: Additional arguments to pass to requests.post.
             
         Returns:
-            Response object.
+            Response object. Its body has been read and the connection returned
+            to the pool, unless stream=True was passed; streaming callers must
+            close the response (or use it as a context manager).
         """
         prepared_headers = self._prepare_headers(headers)
         
         # Pre-request strategies
-        self._execute_strategies("pre")
+        self._execute_strategies("pre", url)
         
-        response = self.session.post(url, headers=prepared_headers, **kwargs)
+        try:
+            response = self.session.post(url, headers=prepared_headers, **kwargs)
+        except requests.RequestException:
+            self._record_result(url, failed=True)
+            raise
+        self._record_result(url, failed=response.status_code >= 500)
         
         # Post-request strategies
-        self._execute_strategies("post")
+        self._execute_strategies("post", url)
         
         return response
 
     @classmethod
-    def create_with_defaults(cls, user_agent: Optional[str] = None) -> 'HttpClient':
+    def create_with_defaults(cls, user_agent: Optional[str] = None,
+                             pool_size: int = DEFAULT_POOL_SIZE) -> 'HttpClient':
         """
         Create an HttpClient with default anti-scraping strategies.
         
         Args:
             user_agent: Optional fixed User-Agent to use.
+            pool_size: Keep-alive connections pooled per host.
             
         Returns:
             Configured HttpClient instance.
@@ -272,7 +505,8 @@ class HttpClient:
         strategies = [
             UserAgentRotationStrategy(fixed_user_agent=user_agent),
             StandardHeadersStrategy(),
+            CircuitBreakerStrategy(),
             RequestThrottlingStrategy(min_delay=1.0, max_delay=3.0),
-            RetryStrategy()
+            RetryStrategy(pool_size=pool_size)
         ]
-        return cls(strategies=strategies) 
\ No newline at end of file
+        return cls(strategies=strategies, pool_size=pool_size) 
\ No newline at end of file